@@ -0,0 +1,73 @@
+"""Benchmark of import time of derivative and functions modules"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULES = ['derivative', 'functions.function', 'functions.expr_parser',
+           'functions.operators', 'functions.simplifier',
+           'functions.compiler', 'functions.cache']
+
+
+def import_time(module: str) -> dict:
+    """
+    Function that measures import time of a module in a fresh interpreter
+
+    Args:
+        module (str): Name of the module
+
+    Returns:
+        dict: Cumulative import time of the module in microseconds\
+            and whether SymPy was imported along with it
+    """
+    code = f"import sys, {module}; print('sympy' in sys.modules)"
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                             cwd=ROOT, capture_output=True, text=True,
+                             check=True)
+    cumulative = None
+    for line in process.stderr.splitlines():
+        fields = [field.strip() for field in line.split('|')]
+        if len(fields) == 3 and fields[2] == module:
+            cumulative = int(fields[1])
+    return {'us': cumulative, 'sympy': process.stdout.strip() == 'True'}
+
+
+def run(modules: list, repeat: int) -> dict:
+    """
+    Function that measures import time of modules
+
+    Args:
+        modules (list): Names of the modules
+        repeat (int): Number of measurements of every module
+
+    Returns:
+        dict: The best import time of every module in microseconds\
+            and whether SymPy was imported along with it
+    """
+    results = {}
+    for module in modules:
+        runs = [import_time(module) for _ in range(repeat)]
+        results[module] = {'us': min(run['us'] for run in runs),
+                           'sympy': runs[0]['sympy']}
+    return {'python': sys.version.split()[0], 'repeat': repeat,
+            'imports': results}
+
+
+def main() -> None:
+    """
+    Prints import times of modules as JSON
+    """
+    parser = argparse.ArgumentParser(
+        description='Benchmark of import time of derivative modules')
+    parser.add_argument('modules', nargs='*', default=MODULES,
+                        help='modules to import (default: all)')
+    parser.add_argument('-r', '--repeat', type=int, default=5,
+                        help='number of measurements (default: 5)')
+    args = parser.parse_args()
+    print(json.dumps(run(args.modules, args.repeat), indent=2))
+
+
+if __name__ == '__main__':
+    main()
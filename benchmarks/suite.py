@@ -0,0 +1,211 @@
+"""Benchmark of parsing, differentiation, simplification,\
+    calculation and serialization of synthetic functions"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# pylint: disable=wrong-import-position
+from functions.function import Function, Simplifier  # noqa: E402
+from functions.expr_parser import Parser  # noqa: E402
+from functions.cache import DIFF_CACHE  # noqa: E402
+
+SIZES = [4, 16, 64, 256]
+POINT = {'x': 0.5, 'y': 1.5, 'z': 2.5}
+
+
+def polynomial(size: int) -> str:
+    """
+    Function that builds a polynomial of a given degree
+
+    Args:
+        size (int): Degree of the polynomial
+
+    Returns:
+        str: The polynomial
+    """
+    return "+".join(f"{power + 1}x^{power}" for power in range(size, 0, -1))
+
+
+def nested(size: int) -> str:
+    """
+    Function that builds a composition of ln, sin and exp\
+        of a given depth, defined for positive x
+
+    Args:
+        size (int): Depth of the composition
+
+    Returns:
+        str: The composition
+    """
+    functions = [('ln', 'sin', 'exp')[level % 3] for level in range(size)]
+    return "(".join(reversed(functions)) + "(x" + ")" * size
+
+
+def long_sum(size: int) -> str:
+    """
+    Function that builds a sum of a given number of terms
+
+    Args:
+        size (int): Number of terms
+
+    Returns:
+        str: The sum
+    """
+    return "+".join(f"{term}{'xyz'[term % 3]}" for term in range(1, size + 1))
+
+
+def implicit(size: int) -> str:
+    """
+    Function that builds a sum of products written\
+        with implicit multiplication
+
+    Args:
+        size (int): Number of products
+
+    Returns:
+        str: The sum of products
+    """
+    return "+".join(f"{term}xsin{'xyz'[term % 3]}cos(y)"
+                    for term in range(1, size + 1))
+
+
+FAMILIES = {
+    'polynomial': polynomial,
+    'nested': nested,
+    'long_sum': long_sum,
+    'implicit': implicit,
+}
+
+
+def measure(stage, setup=None, repeat: int = 5) -> dict:
+    """
+    Function that measures wall time of a stage
+
+    Args:
+        stage (callable): The stage to measure
+        setup (callable, optional): Function that is called before\
+            every measurement and is not measured. Defaults to None
+        repeat (int, optional): Number of measurements. Defaults to 5
+
+    Returns:
+        dict: The best and the median time in seconds
+    """
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        stage()
+        times.append(time.perf_counter() - start)
+    return {'min': min(times), 'median': statistics.median(times)}
+
+
+def _forget_trees() -> None:
+    # Interned nodes are reused while any tree holds them, so caches
+    # that keep trees alive are cleared to measure building new nodes
+    DIFF_CACHE.clear()
+    Parser.cache_clear()
+
+
+def run_case(expression: str, simplifier: Simplifier, repeat: int) -> dict:
+    """
+    Function that measures every stage on a single expression
+
+    Args:
+        expression (str): The expression
+        simplifier (Simplifier): The simplification engine\
+            of differentiation and simplification
+        repeat (int): Number of measurements of every stage
+
+    Returns:
+        dict: Size of the expression and times of the stages
+    """
+    # pylint: disable=protected-access
+    rpn = Parser(expression).rpn
+    stages = {
+        'parse': measure(lambda: Parser(expression).rpn,
+                         Parser.cache_clear, repeat),
+        'build_tree': measure(
+            lambda: Parser(expression).build_tree(Function._token_node),
+            _forget_trees, repeat),
+    }
+    function = Function(expression)
+    point = {name: POINT[name] for name in function.variables}
+    stages |= {
+        'diff': measure(lambda: function.diff('x', True, simplifier),
+                        DIFF_CACHE.clear, repeat),
+        'simplify': measure(lambda: function.simplify(simplifier),
+                            repeat=repeat),
+        'calculate': measure(lambda: function.calculate(**point),
+                             repeat=repeat),
+        'evaluate': measure(lambda: function.evaluate(**point),
+                            repeat=repeat),
+        'str': measure(lambda: str(function), repeat=repeat),
+    }
+    return {'length': len(expression), 'tokens': len(rpn),
+            'nodes': len(function._postorder()), 'stages': stages}
+
+
+def run(families: list, sizes: list, simplifier: Simplifier,
+        repeat: int) -> dict:
+    """
+    Function that measures every stage on the corpus of expressions
+
+    Args:
+        families (list): Names of the families of expressions
+        sizes (list): Sizes of expressions of every family
+        simplifier (Simplifier): The simplification engine\
+            of differentiation and simplification
+        repeat (int): Number of measurements of every stage
+
+    Returns:
+        dict: Environment of the run and results of every expression
+    """
+    results = []
+    for family in families:
+        for size in sizes:
+            case = run_case(FAMILIES[family](size), simplifier, repeat)
+            results.append({'family': family, 'size': size} | case)
+    return {'python': sys.version.split()[0], 'repeat': repeat,
+            'simplifier': simplifier.name, 'results': results}
+
+
+def main() -> None:
+    """
+    Prints times of the stages on the corpus of expressions as JSON
+    """
+    parser = argparse.ArgumentParser(
+        description='Benchmark of parsing, differentiation,\
+            simplification, calculation and serialization')
+    parser.add_argument('-f', '--family', action='append',
+                        choices=list(FAMILIES), dest='families',
+                        help='family of expressions, may be repeated\
+                            (default: all)')
+    parser.add_argument('-s', '--sizes', type=int, nargs='+', default=SIZES,
+                        help='sizes of expressions (default: 4 16 64 256)')
+    parser.add_argument('--simplifier', default='NATIVE',
+                        choices=[simplifier.name for simplifier in Simplifier],
+                        help='simplification engine (default: NATIVE)')
+    parser.add_argument('-r', '--repeat', type=int, default=5,
+                        help='number of measurements (default: 5)')
+    parser.add_argument('-o', '--output',
+                        help='file to write results to instead of\
+                            standard output')
+    args = parser.parse_args()
+    results = run(args.families or list(FAMILIES), args.sizes,
+                  Simplifier[args.simplifier], args.repeat)
+    if args.output is None:
+        print(json.dumps(results, indent=2))
+        return
+    with open(args.output, 'w', encoding='utf-8') as stream:
+        json.dump(results, stream, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,16 @@
 """Module for taking derivative of a function"""
 import argparse
+import json
+import sys
+from collections import namedtuple
+from itertools import islice
 from functions.function import Function
+from functions.cache import DIFF_CACHE
+from functions.expr_parser import ParserException
+from functions.profiling import profile
+
+DiffResult = namedtuple('DiffResult', ['expression', 'result', 'error'])
+_STORE = None
 
 
 def diff(function: str, variable: str = 'x', **values: dict) -> str:
@@ -19,23 +29,235 @@ def diff(function: str, variable: str = 'x', **values: dict) -> str:
     """
     if values:
         return str(Function(function).derive(variable, **values))
-    return str(Function(function).diff(variable))
+    key = (function, variable)
+    derivative = DIFF_CACHE.get(key)
+    if derivative is None and _STORE is not None:
+        derivative = _STORE.get(function, variable)
+        if derivative is not None:
+            DIFF_CACHE.put(key, derivative)
+    if derivative is None:
+        derivative = str(Function(function).diff(variable))
+        DIFF_CACHE.put(key, derivative)
+    return derivative
+
+
+def use_store(store) -> None:
+    """
+    Function that sets a store of derivatives that diff consults\
+        when a derivative is not cached in memory. Worker processes\
+        of diff_many open the same store
+
+    Args:
+        store (DerivativeStore): The store or None to stop using it
+    """
+    global _STORE  # pylint: disable=global-statement
+    _STORE = store
+
+
+def describe_error(error: Exception) -> dict:
+    """
+    Function that describes an error that occurred\
+        while taking a derivative
+
+    Args:
+        error (Exception): The error
+
+    Returns:
+        dict: Name of the error, its message and, for parser errors,\
+            position and length of the wrong token
+    """
+    description = {'error': type(error).__name__}
+    if isinstance(error, ParserException):
+        description['position'] = error.position
+        description['length'] = error.length
+    else:
+        description['message'] = str(error)
+    return description
+
+
+def diff_many(expressions, variable: str = 'x', workers: int = None,
+              chunksize: int = 64, **values: dict) -> list:
+    """
+    Function that takes derivatives of many functions,\
+        optionally in parallel processes
+
+    Args:
+        expressions: Iterable of mathematical functions to derive
+        variable (str, optional): The variable of differentiation.\
+            Defaults to 'x'
+        workers (int, optional): Number of worker processes.\
+            Functions are derived in the current process if not greater\
+            than 1. Defaults to None
+        chunksize (int, optional): Number of functions sent to a worker\
+            at once. Defaults to 64
+        **values: Positional arguments for function variables.\
+            If specified calculates derivatives at a given point
 
+    Returns:
+        list: DiffResult tuples in the order of the functions. Either\
+            result holds the derivative or error holds the description\
+            of the error that occurred
+    """
+    requests = ((expression, variable, values) for expression in expressions)
+    return list(_map_requests(requests, workers, chunksize))
+
+
+def _map_requests(requests, workers: int, chunksize: int):
+    if workers is None or workers <= 1:
+        yield from map(_diff_request, requests)
+        return
+    # pylint: disable=import-outside-toplevel
+    from concurrent.futures import ProcessPoolExecutor
+    requests = iter(requests)
+    store = None if _STORE is None else _STORE.path
+    with ProcessPoolExecutor(workers, initializer=_warm_up,
+                             initargs=(store,)) as executor:
+        while batch := list(islice(requests, 4 * workers * chunksize)):
+            yield from executor.map(_diff_request, batch, chunksize=chunksize)
+
+
+def _warm_up(store: str = None) -> None:
+    if store is not None:
+        # pylint: disable=import-outside-toplevel
+        from functions.store import DerivativeStore
+        use_store(DerivativeStore(store))
+    diff("sin(x)^2")
+
+
+def _diff_request(request: tuple) -> DiffResult:
+    expression, variable, values = request
+    if isinstance(values, Exception):
+        return DiffResult(expression, None, describe_error(values))
+    try:
+        return DiffResult(expression, diff(expression, variable, **values),
+                          None)
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        return DiffResult(expression, None, describe_error(exc))
+
+
+def _parse_point(point: str) -> tuple:
+    name, _, value = point.partition('=')
+    try:
+        return name.strip(), float(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(
+            f"invalid point '{point}', expected name=value") from exc
+
+
+def _read_requests(stream, args: argparse.Namespace):
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        if not args.jsonl:
+            yield line, args.variable, args.point
+            continue
+        try:
+            request = json.loads(line)
+            point = dict(args.point) | request.get('point', {})
+            yield request['expression'], \
+                request.get('variable', args.variable), point
+        except (ValueError, KeyError, TypeError, AttributeError) as exc:
+            yield line, None, exc
 
-def main() -> None:
+
+def _format(result: DiffResult, output_format: str) -> str:
+    if output_format == 'json':
+        record = {'expression': result.expression}
+        if result.error is None:
+            record['result'] = result.result
+        else:
+            record |= result.error
+        return json.dumps(record)
+    if result.error is None:
+        return result.result
+    details = ", ".join(f"{key}={value}" for key, value in result.error.items()
+                        if key != 'error')
+    return f"error: {result.error['error']}: {details}"
+
+
+def main(argv: list = None) -> int:
     """
-    Prints derivative of a specific function
+    Prints derivatives of functions read line by line\
+        from a file or standard input
+
+    Args:
+        argv (list, optional): Command line arguments.\
+            Defaults to sys.argv
+
+    Returns:
+        int: Exit status, 1 if any of the functions failed
     """
     parser = argparse.ArgumentParser(
         prog='derivative',
         description='Module with functionallity for\
             differentiation mathematical functions.\
+            Reads one function per line and prints one result per line.\
             (e.g. [derivative.diff("x^2") -> "2.0*x"],\
                 [derivative.diff("x^2", x=2) -> "4.0"])')
-    _ = parser.parse_args()
+    parser.add_argument('input', nargs='?', default='-',
+                        help='file with functions, standard input if\
+                            omitted or "-"')
+    parser.add_argument('-e', '--expression', action='append',
+                        help='function to derive instead of reading input,\
+                            may be repeated')
+    parser.add_argument('-v', '--variable', default='x',
+                        help='variable of differentiation (default: x)')
+    parser.add_argument('-p', '--point', action='append', default=[],
+                        type=_parse_point, metavar='NAME=VALUE',
+                        help='calculate derivative at a point,\
+                            may be repeated for every variable')
+    parser.add_argument('--jsonl', action='store_true',
+                        help='read JSON objects with "expression" and\
+                            optional "variable" and "point" fields')
+    parser.add_argument('-f', '--format', choices=('text', 'json'),
+                        default='text', help='output format of results\
+                            and errors (default: text)')
+    parser.add_argument('-w', '--workers', type=int, default=1,
+                        help='number of worker processes (default: 1)')
+    parser.add_argument('--chunksize', type=int, default=64,
+                        help='number of functions sent to a worker\
+                            at once (default: 64)')
+    parser.add_argument('--store', metavar='PATH',
+                        help='store of precomputed derivatives consulted\
+                            before differentiation')
+    parser.add_argument('--profile', action='store_true',
+                        help='print time spent in every stage of this\
+                            process to standard error')
+    args = parser.parse_args(argv)
+    args.point = dict(args.point)
+    if args.store is not None:
+        # pylint: disable=import-outside-toplevel
+        from functions.store import DerivativeStore
+        use_store(DerivativeStore(args.store))
+
+    if not args.profile:
+        return _run(args)
+    with profile() as statistics:
+        status = _run(args)
+    print(statistics.summary(), file=sys.stderr)
+    return status
+
+
+def _run(args: argparse.Namespace) -> int:
+    if args.expression:
+        requests = ((expression, args.variable, args.point)
+                    for expression in args.expression)
+        return _process(requests, args)
+    if args.input == '-':
+        return _process(_read_requests(sys.stdin, args), args)
+    with open(args.input, encoding='utf-8') as stream:
+        return _process(_read_requests(stream, args), args)
+
 
-    print(diff("1/lnx^2"))
+def _process(requests, args: argparse.Namespace) -> int:
+    status = 0
+    for result in _map_requests(requests, args.workers, args.chunksize):
+        if result.error is not None:
+            status = 1
+        print(_format(result, args.format))
+    return status
 
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""Module that provides binary serialization of functions"""
+import struct
+import sys
+from array import array
+from .function import Function
+from .flat import FlatFunction, OPERATOR_TOKENS, NUMBER, NAME
+from .operators import OPERATORS, OperatorType
+
+MAGIC = b'DRF1'
+HEADER = struct.Struct('<4sIII')
+NAME_LENGTH = struct.Struct('<H')
+
+
+def dumps(function) -> bytes:
+    """
+    Function that serializes a function to bytes. The data consists\
+        of a header with numbers of nodes, numbers and names, the arrays\
+        of the flat function with little-endian operand indices\
+        and numbers and the table of names
+
+    Args:
+        function (Function | FlatFunction): The function to serialize
+
+    Returns:
+        bytes: Serialized function
+    """
+    flat = function if isinstance(function, FlatFunction) \
+        else FlatFunction(function)
+    left, right = array('i', flat.left), array('i', flat.right)
+    constants = array('d', flat.constants)
+    if sys.byteorder != 'little':
+        for values in (left, right, constants):
+            values.byteswap()
+    parts = [HEADER.pack(MAGIC, len(flat), len(constants), len(flat.names)),
+             left.tobytes(), right.tobytes(), constants.tobytes(),
+             array('b', flat.opcodes).tobytes()]
+    for name in flat.names:
+        encoded = name.encode('utf-8')
+        parts += [NAME_LENGTH.pack(len(encoded)), encoded]
+    return b"".join(parts)
+
+
+def loads(data) -> FlatFunction:
+    """
+    Function that deserializes a flat function. Arrays of the result\
+        are views of the given buffer, so the buffer is not copied\
+        and must not be modified or closed while the function is used
+
+    Args:
+        data: Bytes, memory map or any other buffer with a function\
+            serialized by dumps
+
+    Raises:
+        ValueError: Raises when the data is not a serialized function,\
+            including unknown opcodes, operand or pool indices\
+            that do not refer to earlier nodes, numbers or names\
+            and names that are operators or not identifiers
+
+    Returns:
+        FlatFunction: Deserialized function
+    """
+    view = memoryview(data).cast('B')
+    try:
+        magic, nodes, numbers, names = HEADER.unpack_from(view)
+    except struct.error as exc:
+        raise ValueError("Invalid binary function") from exc
+    if magic != MAGIC:
+        raise ValueError("Invalid binary function")
+
+    offset = HEADER.size
+    flat = FlatFunction()
+    flat.left = _view(view, offset, nodes, 'i')
+    flat.right = _view(view, offset + 4 * nodes, nodes, 'i')
+    offset += 8 * nodes
+    flat.constants = _view(view, offset, numbers, 'd')
+    offset += 8 * numbers
+    flat.opcodes = _view(view, offset, nodes, 'b')
+    offset += nodes
+    for _ in range(names):
+        try:
+            (length,) = NAME_LENGTH.unpack_from(view, offset)
+        except struct.error as exc:
+            raise ValueError("Invalid binary function") from exc
+        offset += NAME_LENGTH.size
+        if offset + length > len(view):
+            raise ValueError("Invalid binary function")
+        flat.names.append(bytes(view[offset:offset + length]).decode('utf-8'))
+        offset += length
+    _check(flat)
+    return flat
+
+
+def load_function(data) -> Function:
+    """
+    Function that deserializes a function tree
+
+    Args:
+        data: Bytes, memory map or any other buffer with a function\
+            serialized by dumps
+
+    Raises:
+        ValueError: Raises when the data is not a serialized function
+
+    Returns:
+        Function: Deserialized function
+    """
+    return loads(data).to_function()
+
+
+def _check(flat: FlatFunction) -> None:
+    for index, (code, left, right) in enumerate(
+            zip(flat.opcodes, flat.left, flat.right)):
+        if code == NUMBER:
+            valid = 0 <= left < len(flat.constants) and right == -1
+        elif code == NAME:
+            valid = 0 <= left < len(flat.names) and right == -1 and \
+                flat.names[left].isidentifier() and \
+                flat.names[left] not in OPERATORS
+        elif 0 <= code < len(OPERATOR_TOKENS):
+            binary = OPERATORS[OPERATOR_TOKENS[code]].operator_type == \
+                OperatorType.BINARY
+            valid = 0 <= left < index and \
+                (0 <= right < index if binary else right == -1)
+        else:
+            valid = False
+        if not valid:
+            raise ValueError("Invalid binary function")
+
+
+def _view(view: memoryview, offset: int, length: int, typecode: str):
+    size = struct.calcsize(typecode) * length
+    if offset + size > len(view):
+        raise ValueError("Invalid binary function")
+    values = view[offset:offset + size].cast(typecode)
+    if sys.byteorder == 'little' or typecode == 'b':
+        return values
+    values = array(typecode, values)
+    values.byteswap()
+    return values
@@ -0,0 +1,104 @@
+"""Module that provides bounded caches for parsed and derived functions"""
+from collections import OrderedDict
+from threading import Lock
+
+
+class LRUCache:
+    """
+    Thread-safe mapping of a bounded size that evicts\
+        the least recently used entries
+
+    Args:
+        maxsize (int, optional): Maximum number of entries.\
+            Defaults to 4096
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self._data = OrderedDict()
+        self._lock = Lock()
+        self._maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        """
+        Property that contains maximum number of entries.\
+            Setting it evicts entries that no longer fit
+
+        Returns:
+            int: Maximum number of entries
+        """
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, maxsize: int) -> None:
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def get(self, key, default=None):
+        """
+        Method that returns the cached value and marks it as recently used
+
+        Args:
+            key: The key of the entry
+            default (optional): Value to return if the key is not cached.\
+                Defaults to None
+
+        Returns:
+            The cached value or default
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key, value) -> None:
+        """
+        Method that caches a value
+
+        Args:
+            key: The key of the entry
+            value: The value to cache
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+
+    def clear(self) -> None:
+        """
+        Method that removes all entries and resets the counters
+        """
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = 0
+
+    def info(self) -> dict:
+        """
+        Method that returns statistics of the cache
+
+        Returns:
+            dict: Numbers of hits, misses and entries and the maximum size
+        """
+        with self._lock:
+            return {'hits': self._hits, 'misses': self._misses,
+                    'size': len(self._data), 'maxsize': self._maxsize}
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _evict(self) -> None:
+        while self._data and len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+
+RPN_CACHE = LRUCache()
+TREE_CACHE = LRUCache()
+DIFF_CACHE = LRUCache()
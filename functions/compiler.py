@@ -0,0 +1,146 @@
+"""Module that provides compilation of functions to Python callables"""
+import keyword
+import math
+from .function import Function
+from .operators import OPERATORS, CONSTANTS, OperatorType
+
+PREFIX_FUNCTIONS = {
+    'sqrt': math.sqrt,
+    'exp': math.exp,
+    'ln': math.log,
+    'sin': math.sin,
+    'cos': math.cos,
+    'tg': math.tan,
+}
+
+
+def compile_function(function: Function, variables: list = None,
+                     check_domain: bool = True) -> callable:
+    """
+    Function that compiles a function to a plain Python callable.\
+        The callable takes values of the variables as positional\
+        arguments and returns a number
+
+    Args:
+        function (Function): The function to compile
+        variables (list, optional): Names of the callable arguments\
+            in the order they are passed. Defaults to sorted\
+            variables of the function
+        check_domain (bool, optional): If set, the callable performs\
+            the same domain checks as Function.calculate.\
+            Defaults to True
+
+    Raises:
+        ValueError: Raises when the function is undefined, depends\
+            on variables that are not listed or when the names are not\
+            distinct Python identifiers or are names of constants
+
+    Returns:
+        callable: Compiled function
+    """
+    if function.value is None:
+        raise ValueError("Function is undefined")
+    if variables is None:
+        variables = sorted(function.variables)
+    for name in variables:
+        if not isinstance(name, str) or not name.isidentifier() or \
+                keyword.iskeyword(name) or name.startswith('_') or \
+                name in PREFIX_FUNCTIONS or name in CONSTANTS:
+            raise ValueError(f"Invalid variable name: {name!r}")
+    if len(set(variables)) != len(variables):
+        raise ValueError("Variable names are not distinct")
+    missing = function.variables - set(variables)
+    if missing:
+        raise ValueError(
+            f"Variables are not listed: {', '.join(sorted(missing))}")
+
+    source, namespace = _generate(function, list(variables), check_domain)
+    exec(source, namespace)  # pylint: disable=exec-used
+    compiled = namespace['_compiled']
+    compiled.source = source
+    return compiled
+
+
+def _generate(function: Function, variables: list,
+              check_domain: bool) -> tuple:
+    namespace = dict(PREFIX_FUNCTIONS)
+    lines = [f"def _compiled({', '.join(variables)}):"]
+    names = {}
+    stack = [(function, False)]
+    while stack:
+        node, visited = stack.pop()
+        if id(node) in names:
+            continue
+        if node.value not in OPERATORS:
+            names[id(node)] = _leaf(node.value, variables, namespace)
+            continue
+        if not visited:
+            stack.append((node, True))
+            if node.right is not None:
+                stack.append((node.right, False))
+            stack.append((node.left, False))
+            continue
+
+        name = f"_t{len(names)}"
+        left = names[id(node.left)]
+        if OPERATORS[node.value].operator_type == OperatorType.BINARY:
+            right = names[id(node.right)]
+            lines += _binary(name, node.value, left, right, check_domain)
+        elif node.value == 'unary-':
+            lines.append(f"    {name} = -{left}")
+        else:
+            lines += _prefix(name, node.value, left, check_domain)
+        names[id(node)] = name
+    lines.append(f"    return {names[id(function)]}")
+    return "\n".join(lines), namespace
+
+
+def _leaf(value, variables: list, namespace: dict) -> str:
+    if value in variables:
+        return value
+    if value in CONSTANTS:
+        value = CONSTANTS[value]
+    if math.isfinite(value):
+        return f"({value!r})" if value < 0 else repr(value)
+    name = f"_c{len(namespace)}"
+    namespace[name] = value
+    return name
+
+
+def _binary(name: str, operator: str, left: str,
+            right: str, check_domain: bool) -> list:
+    python_operator = '**' if operator == '^' else operator
+    exponent = _literal(right) if operator == '^' else None
+    lines = []
+    if check_domain and operator == '/' and _literal(right) in (None, 0.0):
+        lines.append(f"    if {right} == 0.0: raise ZeroDivisionError")
+    if check_domain and operator == '^' and \
+            (exponent is None or exponent <= 0):
+        lines.append(f"    if {left} == 0.0 and {right} <= 0: "
+                     "raise ZeroDivisionError")
+    lines.append(f"    {name} = {left} {python_operator} {right}")
+    if check_domain and operator == '^' and \
+            (exponent is None or not exponent.is_integer()):
+        lines.append(f"    if {name}.__class__ is complex: "
+                     "raise ValueError('Argument is out of function domain')")
+    return lines
+
+
+def _literal(name: str) -> float:
+    try:
+        return float(name.strip('()'))
+    except ValueError:
+        return None
+
+
+def _prefix(name: str, operator: str, child: str,
+            check_domain: bool) -> list:
+    lines = []
+    if check_domain and operator == 'sqrt':
+        lines.append(f"    if {child} < 0.0: "
+                     "raise ValueError('Argument is out of function domain')")
+    if check_domain and operator == 'ln':
+        lines.append(f"    if {child} <= 0.0: "
+                     "raise ValueError('Argument is out of function domain')")
+    lines.append(f"    {name} = {operator}({child})")
+    return lines
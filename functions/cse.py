@@ -0,0 +1,74 @@
+"""Module that provides common subexpression elimination for functions"""
+from .function import Function
+from .operators import OPERATORS
+
+
+def cse(function: Function, prefix: str = 't') -> tuple:
+    """
+    Function that replaces subexpressions occurring in a function\
+        more than once with temporaries. Every temporary depends only\
+        on variables and earlier temporaries
+
+    Args:
+        function (Function): The function to transform
+        prefix (str, optional): Prefix of names of the temporaries.\
+            Defaults to 't'
+
+    Returns:
+        tuple: List of pairs of names of the temporaries and their\
+            functions and the function written in terms of the temporaries
+    """
+    # pylint: disable=protected-access
+    order = function._postorder()
+    uses = {}
+    for node in order:
+        for child in (node.left, node.right):
+            if child is not None:
+                uses[child] = uses.get(child, 0) + 1
+
+    variables = function.variables
+    names = {}
+    rewritten = {}
+    temporaries = []
+    for node in order:
+        if node.value not in OPERATORS:
+            rewritten[node] = node
+            continue
+        left = names.get(node.left, rewritten[node.left])
+        right = None if node.right is None \
+            else names.get(node.right, rewritten[node.right])
+        rewritten[node] = Function.node(node.value, left, right)
+        if uses.get(node, 0) > 1:
+            name = _name(prefix, len(temporaries) + 1, variables)
+            names[node] = Function.node(name)
+            temporaries.append((name, rewritten[node]))
+    return temporaries, rewritten[function]
+
+
+def cse_str(function: Function, prefix: str = 't') -> str:
+    """
+    Function that writes a function with common subexpressions\
+        replaced with temporaries
+
+    Args:
+        function (Function): The function to write
+        prefix (str, optional): Prefix of names of the temporaries.\
+            Defaults to 't'
+
+    Returns:
+        str: Definitions of the temporaries followed by the function,\
+            separated with semicolons
+    """
+    if not function.validate_function():
+        return str(function)
+    temporaries, expression = cse(function, prefix)
+    return "; ".join([f"{name} = {temporary}"
+                      for name, temporary in temporaries] +
+                     [str(expression)])
+
+
+def _name(prefix: str, number: int, variables: set) -> str:
+    name = f"{prefix}{number}"
+    while name in variables:
+        name = f"_{name}"
+    return name
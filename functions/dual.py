@@ -0,0 +1,130 @@
+"""Module that provides forward mode automatic differentiation\
+    of functions with dual numbers"""
+import math
+from .function import Function
+from .operators import OPERATORS, CONSTANTS, calculate_operator
+
+
+def derive_forward(function: Function, variable: str = 'x',
+                   **values) -> float:
+    """
+    Function that takes derivative of a function with respect\
+        to a given variable and at a given point in a single walk\
+        over the function tree. Every node is evaluated to a dual number,\
+        a pair of its value and the value of its derivative
+
+    Args:
+        function (Function): The function to derive
+        variable (str, optional): The variable of differentiation.\
+            Defaults to 'x'
+        **values: Positional arguments for function variables.\
+            Every variable of the function must be specified
+
+    Raises:
+        ValueError: Raises when either a given point is specified\
+            incorrectly or when a derivative does not exists at that point
+
+    Returns:
+        float: Derivative of a function at a given point
+    """
+    # pylint: disable=protected-access
+    if function.value is None:
+        raise ValueError("Derivative at that point does not exist")
+    duals = {}
+    try:
+        for node in function._postorder():
+            duals[node] = _dual(node, duals, variable, values)
+    except KeyError as exc:
+        raise ValueError("Point was not specified correctly") from exc
+    except (ZeroDivisionError, ValueError) as exc:
+        raise ValueError("Derivative at that point does not exist") from exc
+    derivative = duals[function][1]
+    return 0.0 if derivative is None else derivative
+
+
+def _dual(node: Function, duals: dict, variable: str, values: dict) -> tuple:
+    value = node.value
+    if value not in OPERATORS:
+        derivative = 1.0 if value == variable else None
+        if value in values:
+            return values[value], derivative
+        if value in CONSTANTS:
+            return CONSTANTS[value], derivative
+        if isinstance(value, str):
+            raise KeyError(value)
+        return value, None
+
+    left = duals[node.left]
+    if node.right is None:
+        result = calculate_operator(value, left[0])
+        if left[1] is None:
+            _check_constant(node, result, left[0])
+            return result, None
+        return result, _derivative(value, result, left, (None, None))
+    right = duals[node.right]
+    result = calculate_operator(value, left[0], right[0])
+    if left[1] is None and right[1] is None:
+        _check_constant(node, result, left[0])
+        return result, None
+    return result, _derivative(value, result, left, right)
+
+
+def _check_constant(node: Function, result: float, left: float) -> None:
+    # The symbolic rules are applied to numeric subexpressions too,
+    # so their zero derivatives have the same domain as the rules
+    # pylint: disable=protected-access
+    if node._constant is None:
+        return
+    if node.value == 'sqrt' and result == 0.0:
+        raise ZeroDivisionError
+    if node.value == '^' and left <= 0.0:
+        raise ValueError("Argument is out of function domain")
+
+
+def _derivative(operator: str, result: float,
+                left: tuple, right: tuple) -> float:
+    # pylint: disable=too-many-return-statements
+    (u, du), (v, dv) = left, right
+    if operator == '^':
+        return _derivative_pow(result, u, du, v, dv)
+    du = 0.0 if du is None else du
+    dv = 0.0 if dv is None else dv
+    match operator:
+        case '+':
+            return du + dv
+        case '-':
+            return du - dv
+        case 'unary-':
+            return -du
+        case '*':
+            return du * v + u * dv
+        case '/':
+            return (du * v - u * dv) / v ** 2
+        case 'sqrt':
+            if result == 0.0:
+                raise ZeroDivisionError
+            return du / (2 * result)
+        case 'exp':
+            return du * result
+        case 'ln':
+            return du / u
+        case 'sin':
+            return du * math.cos(u)
+        case 'cos':
+            return -du * math.sin(u)
+        case 'tg':
+            return du / math.cos(u) ** 2
+    raise ValueError(f"Unknown operator '{operator}'")
+
+
+def _derivative_pow(result: float, u: float, du: float,
+                    v: float, dv: float) -> float:
+    if dv is None and v == 1.0:
+        return du
+    if dv is None:
+        return v * calculate_operator('^', u, v - 1.0) * du
+    if u <= 0.0:
+        raise ValueError("Argument is out of function domain")
+    if du is None:
+        return result * dv * math.log(u)
+    return result * (dv * math.log(u) + v * du / u)
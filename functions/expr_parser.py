@@ -1,11 +1,30 @@
 """Module that provides functionality for parsing mathematical expressions"""
 import re
 from .operators import OPERATORS, CONSTANTS, OperatorType, Associativity
+from .cache import RPN_CACHE, TREE_CACHE
+from .profiling import profiled, count
 
 NUM_REGEX = re.compile(r"[\d,.]+")
 VAR_REGEX = re.compile(r"[A-Za-z]+")
 
 
+def _symbol_pattern(symbol: str, symbols: list) -> str:
+    longer = [other[len(symbol):] for other in symbols
+              if other != symbol and other.startswith(symbol)]
+    return re.escape(symbol) + "".join(f"(?!{re.escape(rest)})"
+                                       for rest in longer)
+
+
+_SYMBOLS = [symbol for symbol in OPERATORS | CONSTANTS
+            if VAR_REGEX.fullmatch(symbol)]
+SYMBOL_REGEX = re.compile("|".join(_symbol_pattern(symbol, _SYMBOLS)
+                                   for symbol in _SYMBOLS))
+_CHARS = "".join(symbol for symbol in OPERATORS if len(symbol) == 1)
+TOKEN_REGEX = re.compile(
+    rf"(?P<number>{NUM_REGEX.pattern})|(?P<word>{VAR_REGEX.pattern})|"
+    rf"(?P<operator>[{re.escape(_CHARS)}()])|(?P<invalid>.)", re.DOTALL)
+
+
 class ParserException(Exception):
     """
     Base exception for errors that may occur during expression parsing
@@ -105,28 +124,95 @@ class Parser:
         return self._expression
 
     @property
-    def rpn(self) -> list:
+    def rpn(self) -> tuple:
         """
-        Property that contains given expression in reverse polish notation
+        Property that contains given expression in reverse polish notation.\
+            Results are shared between parsers of equal expressions
 
         Returns:
-            list: A list of expression tokens written\
+            tuple: A tuple of expression tokens written\
                 in reverse polish notation
         """
         if self._rpn is None:
-            self._rpn = self._parse_to_rpn()
+            self._rpn = RPN_CACHE.get(self._expression)
+        if self._rpn is None:
+            self._rpn = tuple(self._parse_to_rpn())
+            RPN_CACHE.put(self._expression, self._rpn)
         return self._rpn
 
+    @staticmethod
+    def cache_info() -> dict:
+        """
+        Method that returns statistics of the caches\
+            of parsed expressions
+
+        Returns:
+            dict: Statistics of the caches of tokens in reverse polish\
+                notation and of built trees
+        """
+        return {'rpn': RPN_CACHE.info(), 'tree': TREE_CACHE.info()}
+
+    @staticmethod
+    def cache_clear() -> None:
+        """
+        Method that clears the caches of parsed expressions
+        """
+        RPN_CACHE.clear()
+        TREE_CACHE.clear()
+
+    @profiled('build_tree')
+    def build_tree(self, make_node: callable):
+        """
+        Method that builds a tree of the expression in a single pass,\
+            without the intermediate list of tokens in reverse\
+            polish notation. Trees are shared between parsers of equal\
+            expressions built with the same make_node, so nodes\
+            must be immutable
+
+        Args:
+            make_node (callable): Function that is called with a token\
+                and its already built operands and returns a tree node
+
+        Returns:
+            The root node of the tree or None if the expression is empty
+        """
+        key = (self._expression, make_node)
+        tree = TREE_CACHE.get(key)
+        if tree is not None:
+            return tree
+        operands = []
+
+        def add_node(token: str) -> None:
+            if token not in OPERATORS:
+                operands.append(make_node(token))
+            elif OPERATORS[token].operator_type == OperatorType.BINARY:
+                right = operands.pop()
+                operands.append(make_node(token, operands.pop(), right))
+            else:
+                operands.append(make_node(token, operands.pop()))
+
+        self._parse(add_node)
+        if not operands:
+            return None
+        TREE_CACHE.put(key, operands[-1])
+        return operands[-1]
+
+    @profiled('parse')
     def _parse_to_rpn(self) -> list:
-        stack = []
         result = []
+        self._parse(result.append)
+        count('parse.tokens', len(result))
+        return result
+
+    def _parse(self, emit: callable) -> None:
+        stack = []
         tokens = self._tokenize()
         prev_token = None
         position = 0
         open_bracket_pos = []
 
         def add_binary_op(operator: str) -> None:
-            nonlocal stack, result, peek
+            nonlocal peek
             while stack and peek in OPERATORS and \
                 (OPERATORS.get(peek).priority >
                  OPERATORS.get(operator).priority or
@@ -134,7 +220,7 @@ class Parser:
                   Associativity.RIGHT_ASSOCIATIVE and
                   OPERATORS.get(peek).priority ==
                   OPERATORS.get(operator).priority)):
-                result.append(stack.pop())
+                emit(stack.pop())
                 peek = self._peek(stack)
             stack.append(operator)
 
@@ -159,7 +245,7 @@ class Parser:
                         OperatorType.POSTFIX:  # pragma: no cover
                     self._entity_placement_error_checker(prev_token, position,
                                                          len(token), False)
-                    result.append(token)
+                    emit(token)
                 elif OPERATORS.get(token).operator_type == OperatorType.PREFIX:
                     add_skipped_mul()
                     stack.append(token)
@@ -177,7 +263,7 @@ class Parser:
                 self._entity_placement_error_checker(
                     prev_token, position, 1, False)
                 while stack and peek != '(':
-                    result.append(stack.pop())
+                    emit(stack.pop())
                     peek = self._peek(stack)
                 if stack:
                     peek = self._peek(stack)
@@ -189,7 +275,7 @@ class Parser:
             else:
                 self._invalid_number_error_checker(token, position)
                 add_skipped_mul()
-                result.append(token)
+                emit(token)
 
             prev_token = token
             position += len(token) if token != 'unary-' else 1
@@ -203,54 +289,27 @@ class Parser:
             entity = stack.pop()
             self._parenthesis_mismatch_error_checker(entity, None,
                                                      open_bracket_pos, True)
-            result.append(entity)
-
-        return result
+            emit(entity)
 
     def _tokenize(self) -> list:
         result = []
-        temp = ""
-        position = 0
-
-        def add_num_to_tokens():
-            nonlocal result, temp
-            if NUM_REGEX.match(temp):
-                temp = temp.replace(',', '.')
-                result.append(temp)
-                temp = ""
-
-        def add_var_to_tokens():
-            nonlocal result, temp
-            if VAR_REGEX.match(temp):
-                result += list(temp)
-                temp = ""
-
-        for index, char in enumerate(self.expression):
-            if char in OPERATORS or char in ['(', ')']:
-                add_num_to_tokens()
-                add_var_to_tokens()
-                result.append(char)
-            elif NUM_REGEX.match(char):
-                add_var_to_tokens()
-                temp += char
-            elif VAR_REGEX.match(char):
-                add_num_to_tokens()
-                temp += char
-                for symbol in OPERATORS | CONSTANTS:
-                    if char == 'e' and \
-                            self.expression[index:index + 3] == 'exp':
-                        break
-                    if temp.endswith(symbol):
-                        result += list(temp[:-len(symbol)])
-                        result.append(symbol)
-                        temp = ""
-            else:
-                raise InvalidCharacterError(self.expression, position)
-            position += 1
-
-        if temp:
-            add_num_to_tokens()
-            add_var_to_tokens()
+        for match in TOKEN_REGEX.finditer(self.expression):
+            token = match.group()
+            match match.lastgroup:
+                case 'number':
+                    result.append(token.replace(',', '.'))
+                case 'word':
+                    position = 0
+                    for symbol in SYMBOL_REGEX.finditer(token):
+                        result += token[position:symbol.start()]
+                        result.append(symbol.group())
+                        position = symbol.end()
+                    result += token[position:]
+                case 'invalid':
+                    raise InvalidCharacterError(self.expression,
+                                                match.start())
+                case _:
+                    result.append(token)
         return result
 
     def _peek(self, stack):
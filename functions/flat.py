@@ -0,0 +1,343 @@
+"""Module that provides a compact array-backed representation of functions"""
+from array import array
+from .function import Function
+from .operators import OPERATORS, CONSTANTS, OperatorType, \
+    calculate_operator, needs_parentheses
+
+OPERATOR_TOKENS = tuple(OPERATORS)
+OPCODES = {token: code for code, token in enumerate(OPERATOR_TOKENS)}
+NUMBER = -1
+NAME = -2
+
+
+class FlatFunction:
+    """
+    Class that represents a function as a struct of arrays.\
+        Node i has opcode opcodes[i], which is either an index\
+        of an operator in OPERATORS, NUMBER or NAME. Operands of operator\
+        nodes are indices of earlier nodes in left and right (-1 if absent),\
+        numbers and names refer to constants and names through left.\
+        Equal subexpressions are stored once and the last node is the root
+
+    Args:
+        function (Function, optional): The function to convert.\
+            Defaults to None
+    """
+
+    __slots__ = ('opcodes', 'left', 'right', 'constants', 'names')
+
+    def __init__(self, function: Function = None) -> None:
+        self.opcodes = array('b')
+        self.left = array('q')
+        self.right = array('q')
+        self.constants = array('d')
+        self.names = []
+        if function is not None and function.value is not None:
+            _Builder(self).add_function(function)
+
+    def __len__(self) -> int:
+        return len(self.opcodes)
+
+    @classmethod
+    def from_function(cls, function: Function):
+        """
+        Method that converts a function to the flat representation
+
+        Args:
+            function (Function): The function to convert
+
+        Returns:
+            FlatFunction: The flat function
+        """
+        return cls(function)
+
+    def to_function(self) -> Function:
+        """
+        Method that converts a flat function to a function tree
+
+        Returns:
+            Function: The function
+        """
+        node = Function.node
+        if not self.opcodes:
+            return node(None)
+        nodes = []
+        for code, left, right in zip(self.opcodes, self.left, self.right):
+            if code == NUMBER:
+                nodes.append(node(self.constants[left]))
+            elif code == NAME:
+                nodes.append(node(self.names[left]))
+            else:
+                nodes.append(node(OPERATOR_TOKENS[code], nodes[left],
+                                  nodes[right] if right >= 0 else None))
+        return nodes[-1]
+
+    def evaluate(self, **values) -> float:
+        """
+        Method that evaluates a flat function at a point to a number
+
+        Args:
+            **values: Positional arguments for function variables.\
+                Every variable of the function must be specified
+
+        Raises:
+            ZeroDivisionError: Raises when division by zero occurs
+            ValueError: Raises when a function receives an argument\
+                that is out of its domain, when the function is undefined\
+                or when not every variable was specified
+
+        Returns:
+            float: Value of the function
+        """
+        if not self.opcodes:
+            raise ValueError("Function is undefined")
+        results = []
+        for code, left, right in zip(self.opcodes, self.left, self.right):
+            if code == NUMBER:
+                results.append(self.constants[left])
+            elif code == NAME:
+                results.append(self._name_value(self.names[left], values))
+            elif right >= 0:
+                results.append(calculate_operator(
+                    OPERATOR_TOKENS[code], results[left], results[right]))
+            else:
+                results.append(calculate_operator(OPERATOR_TOKENS[code],
+                                                  results[left]))
+        return results[-1]
+
+    @staticmethod
+    def _name_value(name: str, values: dict) -> float:
+        if name in values:
+            return values[name]
+        if name in CONSTANTS:
+            return CONSTANTS[name]
+        raise ValueError("Point was not specified correctly")
+
+    def diff(self, variable: str = 'x'):
+        """
+        Method that differentiates a flat function without simplification.\
+            The result has the same structure as\
+            Function.diff(variable, True, Simplifier.NONE)
+
+        Args:
+            variable (str, optional): The variable of differentiation.\
+                Defaults to 'x'
+
+        Returns:
+            FlatFunction: Derivative of a function
+        """
+        derivative = FlatFunction()
+        if not self.opcodes:
+            return derivative
+        builder = _Builder(derivative)
+        nodes = []
+        derivatives = []
+        for code, left, right in zip(self.opcodes, self.left, self.right):
+            if code == NUMBER:
+                nodes.append(builder.number(self.constants[left]))
+                derivatives.append(builder.number(0.0))
+            elif code == NAME:
+                nodes.append(builder.name(self.names[left]))
+                derivatives.append(builder.number(
+                    1.0 if self.names[left] == variable else 0.0))
+            else:
+                operands = (nodes[left], nodes[right] if right >= 0 else -1)
+                nodes.append(builder.operator(OPERATOR_TOKENS[code],
+                                              *operands))
+                derivatives.append(builder.derivative(
+                    OPERATOR_TOKENS[code], nodes[-1], *operands,
+                    derivatives[left],
+                    derivatives[right] if right >= 0 else -1))
+        builder.compact(derivatives[-1])
+        return derivative
+
+    def is_valid(self) -> bool:
+        """
+        Method checks if function has an illegal operation\
+            (e.g. division by zero) the same way as\
+            Function.validate_function without a point
+
+        Returns:
+            bool: Function validity
+        """
+        if not self.opcodes:
+            return False
+        constants = []
+        for code, left, right in zip(self.opcodes, self.left, self.right):
+            if code == NUMBER:
+                constants.append(self.constants[left])
+                continue
+            if code == NAME:
+                constants.append(CONSTANTS.get(self.names[left]))
+                continue
+            token = OPERATOR_TOKENS[code]
+            operands = [constants[left]]
+            if right >= 0:
+                operands.append(constants[right])
+            if token == '/' and operands[1] == 0.0:
+                return False
+            if None in operands:
+                constants.append(None)
+                continue
+            try:
+                constants.append(calculate_operator(token, *operands))
+            except (ZeroDivisionError, ValueError):
+                return False
+            except OverflowError:
+                constants.append(None)
+        return True
+
+    def __str__(self) -> str:
+        if not self.is_valid():
+            return "undefined"
+        return "".join(self._tokens())
+
+    def _tokens(self):
+        stack = [len(self.opcodes) - 1]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                yield item
+                continue
+            code = self.opcodes[item]
+            if code == NUMBER:
+                yield str(self.constants[self.left[item]])
+                continue
+            if code == NAME:
+                yield self.names[self.left[item]]
+                continue
+            token = OPERATOR_TOKENS[code]
+            if OPERATORS[token].operator_type == OperatorType.PREFIX:
+                tokens = ['-' if token == 'unary-' else token] + \
+                    self._wrap(token, self.left[item], False)
+            else:
+                tokens = self._wrap(token, self.left[item], False) + \
+                    [token] + self._wrap(token, self.right[item], True)
+            stack.extend(reversed(tokens))
+
+    def _wrap(self, token: str, child: int, right: bool) -> list:
+        code = self.opcodes[child]
+        if code == NUMBER:
+            operand = self.constants[self.left[child]]
+        elif code == NAME:
+            operand = self.names[self.left[child]]
+        else:
+            operand = OPERATOR_TOKENS[code]
+        if needs_parentheses(token, operand, right):
+            return ['(', child, ')']
+        return [child]
+
+
+class _Builder:
+    def __init__(self, flat: FlatFunction) -> None:
+        self._flat = flat
+        self._nodes = {}
+        self._constants = {}
+        self._names = {}
+
+    def add_function(self, function: Function) -> int:
+        # pylint: disable=protected-access
+        indices = {}
+        for node in function._postorder():
+            if node.value in OPERATORS:
+                indices[node] = self.operator(
+                    node.value, indices[node.left],
+                    indices[node.right] if node.right is not None else -1)
+            elif isinstance(node.value, str):
+                indices[node] = self.name(node.value)
+            else:
+                indices[node] = self.number(node.value)
+        return indices[function]
+
+    def _node(self, code: int, left: int, right: int = -1) -> int:
+        key = (code, left, right)
+        index = self._nodes.get(key)
+        if index is None:
+            index = len(self._flat.opcodes)
+            self._flat.opcodes.append(code)
+            self._flat.left.append(left)
+            self._flat.right.append(right)
+            self._nodes[key] = index
+        return index
+
+    def number(self, value: float) -> int:
+        pool = self._constants.get(value)
+        if pool is None:
+            pool = self._constants[value] = len(self._flat.constants)
+            self._flat.constants.append(value)
+        return self._node(NUMBER, pool)
+
+    def name(self, name: str) -> int:
+        pool = self._names.get(name)
+        if pool is None:
+            pool = self._names[name] = len(self._flat.names)
+            self._flat.names.append(name)
+        return self._node(NAME, pool)
+
+    def operator(self, token: str, left: int, right: int = -1) -> int:
+        return self._node(OPCODES[token], left, right)
+
+    def derivative(self, token: str, index: int, left: int, right: int,
+                   left_derivative: int, right_derivative: int) -> int:
+        # pylint: disable=too-many-arguments,too-many-return-statements
+        op, number = self.operator, self.number
+        match token:
+            case '+' | '-':
+                return op(token, left_derivative, right_derivative)
+            case 'unary-':
+                return op('unary-', left_derivative)
+            case '*':
+                return op('+', op('*', left_derivative, right),
+                          op('*', left, right_derivative))
+            case '/':
+                return op('/', op('-', op('*', left_derivative, right),
+                                  op('*', left, right_derivative)),
+                          op('^', right, number(2.0)))
+            case '^':
+                return op('*',
+                          op('+', op('/', op('*', left_derivative, right),
+                                     left),
+                             op('*', op('ln', left), right_derivative)),
+                          index)
+            case 'sqrt':
+                return op('/', left_derivative,
+                          op('*', number(2.0), index))
+            case 'exp':
+                return op('*', left_derivative, index)
+            case 'ln':
+                return op('/', left_derivative, left)
+            case 'sin':
+                return op('*', left_derivative, op('cos', left))
+            case 'cos':
+                return op('unary-',
+                          op('*', left_derivative, op('sin', left)))
+            case 'tg':
+                return op('/', left_derivative,
+                          op('^', op('cos', left), number(2.0)))
+        raise ValueError(f"Unknown operator '{token}'")
+
+    def compact(self, root: int) -> None:
+        flat = self._flat
+        reachable = bytearray(len(flat.opcodes))
+        reachable[root] = 1
+        for index in range(root, -1, -1):
+            if reachable[index] and flat.opcodes[index] >= 0:
+                reachable[flat.left[index]] = 1
+                if flat.right[index] >= 0:
+                    reachable[flat.right[index]] = 1
+        renumbered = [-1] * len(flat.opcodes)
+        opcodes, left, right = array('b'), array('q'), array('q')
+        for index in range(root + 1):
+            if not reachable[index]:
+                continue
+            renumbered[index] = len(opcodes)
+            code = flat.opcodes[index]
+            opcodes.append(code)
+            if code < 0:
+                left.append(flat.left[index])
+                right.append(-1)
+            else:
+                left.append(renumbered[flat.left[index]])
+                right.append(renumbered[flat.right[index]]
+                             if flat.right[index] >= 0 else -1)
+        flat.opcodes, flat.left, flat.right = opcodes, left, right
@@ -1,55 +1,191 @@
 """Module that provides functionality for\
     working with mathematical functions"""
-from sympy import sympify, simplify, nsimplify
-from .operators import OPERATORS, CONSTANTS, OperatorType, Associativity
+import math
+from enum import Enum
+from itertools import islice
+from threading import Lock
+from weakref import WeakValueDictionary
+from .operators import OPERATORS, CONSTANTS, OperatorType, \
+    calculate_operator, needs_parentheses
 from .expr_parser import Parser, NUM_REGEX
+from .cache import DIFF_CACHE
+from .profiling import profiled, count
+
+_INTERNED = WeakValueDictionary()
+_INTERN_LOCK = Lock()
+
+
+class Simplifier(Enum):
+    """
+    Enum class to describe simplification engine
+    """
+    NONE = 0
+    NATIVE = 1
+    SYMPY = 2
 
 
 class Function:
     """
-    Class that represents a mathematical function
+    Class that represents a mathematical function.\
+        Nodes of the function tree are immutable and interned,\
+        so structurally equal subexpressions are stored once\
+        and can be compared by identity
 
     Args:
         expression (str, optional): The mathematical expression\
             that represents a function. Defaults to None
     """
 
-    def __init__(self, expression: str = None) -> None:
-        self.left = None
-        self.right = None
-        self.value = None
+    __slots__ = ('_value', '_left', '_right', '_valid', '_constant',
+                 '__weakref__')
+
+    def __new__(cls, expression: str = None):
+        if not expression or expression in ("undefined", "nan"):
+            return cls.node(None)
+        return Parser(expression).build_tree(cls._token_node) or \
+            cls.node(None)
+
+    def __reduce__(self):
+        indices = {}
+        nodes = []
+        for node in self._postorder():
+            indices[node] = len(nodes)
+            nodes.append((node._value, indices.get(node._left, -1),
+                          indices.get(node._right, -1)))
+        return Function._from_postorder, (tuple(nodes),)
+
+    @classmethod
+    def _from_postorder(cls, nodes: tuple):
+        built = []
+        for value, left, right in nodes:
+            built.append(cls.node(value, built[left] if left >= 0 else None,
+                                  built[right] if right >= 0 else None))
+        return built[-1]
+
+    @classmethod
+    def node(cls, value, left=None, right=None):
+        """
+        Method that returns the interned node of a function tree
 
-        if expression in ("undefined", "nan"):
-            self._build_tree([])
-        elif expression:
-            rpn = Parser(expression).rpn
-            self._build_tree(rpn)
+        Args:
+            value: Operator token, variable name or number of the node
+            left (Function, optional): The left operand. Defaults to None
+            right (Function, optional): The right operand. Defaults to None
 
-    def _build_tree(self, rpn: list) -> None:
+        Returns:
+            Function: The node with the given value and operands
+        """
+        key = (value.__class__, value, left, right)
+        if value.__class__ is float and value == 0.0:
+            key += (math.copysign(1.0, value),)
+        node = _INTERNED.get(key)
+        if node is None:
+            node = object.__new__(cls)
+            node._value = value
+            node._left = left
+            node._right = right
+            node._valid, node._constant = cls._fold(value, left, right)
+            with _INTERN_LOCK:
+                node = _INTERNED.setdefault(key, node)
+        return node
+
+    @staticmethod
+    def _fold(value, left, right) -> tuple:
         # pylint: disable=protected-access
-        if not rpn:
-            return
+        if value is None:
+            return False, None
+        if value not in OPERATORS:
+            if value in CONSTANTS:
+                return True, CONSTANTS[value]
+            return True, None if isinstance(value, str) else value
+        if not left._valid or right is not None and not right._valid:
+            return False, None
+        if value == '/' and right._constant == 0.0:
+            return False, None
+        if left._constant is None or \
+                right is not None and right._constant is None:
+            return True, None
+        try:
+            if right is None:
+                return True, calculate_operator(value, left._constant)
+            return True, calculate_operator(value, left._constant,
+                                            right._constant)
+        except (ZeroDivisionError, ValueError):
+            return False, None
+        except OverflowError:
+            return True, None
+
+    @classmethod
+    def _token_node(cls, token: str, left=None, right=None):
+        value = float(token) if NUM_REGEX.match(token) else token
+        return cls.node(value, left, right)
+
+    def _postorder(self) -> list:
+        order = []
+        visited = set()
+        stack = [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                order.append(node)
+                continue
+            if node in visited:
+                continue
+            visited.add(node)
+            stack.append((node, True))
+            if node.right is not None:
+                stack.append((node.right, False))
+            if node.left is not None:
+                stack.append((node.left, False))
+        return order
+
+    @property
+    def value(self):
+        """
+        Property that contains value of the node
+
+        Returns:
+            Operator token, variable name or number of the node
+        """
+        return self._value
 
-        token = rpn.pop()
-        if NUM_REGEX.match(token):
-            self.value = float(token)
-        else:
-            self.value = token
+    @property
+    def left(self):
+        """
+        Property that contains the left operand of the node
 
-        if token not in OPERATORS:
-            return
+        Returns:
+            Function: The left operand
+        """
+        return self._left
+
+    @property
+    def right(self):
+        """
+        Property that contains the right operand of the node
+
+        Returns:
+            Function: The right operand
+        """
+        return self._right
 
-        if OPERATORS[token].operator_type == OperatorType.BINARY:
-            self.right = Function()
-            self.right._build_tree(rpn)
+    @property
+    def variables(self) -> set:
+        """
+        Property that contains variables of the function
 
-        self.left = Function()
-        self.left._build_tree(rpn)
+        Returns:
+            set: Names of the variables the function depends on
+        """
+        return {node.value for node in self._postorder()
+                if isinstance(node.value, str) and
+                node.value not in OPERATORS and node.value not in CONSTANTS}
 
     def validate_function(self, **values) -> bool:
         """
         Method checks if function has an illegal operation\
-            (e.g. division by zero)
+            (e.g. division by zero). Validity of the function without\
+            a point is tracked on its nodes and is not recalculated
 
         Args:
             **values: Positional arguments for function variables. \
@@ -59,29 +195,48 @@ class Function:
         Returns:
             bool: Function validity
         """
-        if self.value is None:
-            return False
+        if not values:
+            return self._valid
         try:
-            self.calculate(**values)
+            try:
+                self._evaluate(values)
+                return True
+            except KeyError:
+                self.calculate(**values)
         except (ZeroDivisionError, ValueError):
             return False
         return True
 
-    def simplify(self):
+    @profiled('simplify')
+    def simplify(self, simplifier: Simplifier = Simplifier.SYMPY):
         """
         Method that simplifies and returns new function
 
+        Args:
+            simplifier (Simplifier, optional): The simplification engine.\
+                Defaults to Simplifier.SYMPY
+
         Returns:
             Function: Simplified function
         """
+        if simplifier == Simplifier.NONE:
+            return self
+        if simplifier == Simplifier.NATIVE:
+            # pylint: disable=import-outside-toplevel
+            from .simplifier import simplify_native
+            return simplify_native(self)
         if not self.validate_function():
             return self
+        # pylint: disable=import-outside-toplevel
+        from sympy import sympify, simplify, nsimplify
+        count('sympy.calls')
         expr = str(self).replace('tg', 'tan').replace('e', 'E')
         simplified = str(simplify(nsimplify(sympify(expr))))
         simplified = simplified.replace('tan', 'tg') \
             .replace('E', 'e').replace('log', 'ln').replace('**', '^')
         return Function(simplified)
 
+    @profiled('calculate')
     def calculate(self, **values: dict):
         """
         Method that evaluates a function with given variables
@@ -98,326 +253,493 @@ class Function:
         Returns:
             Function: Reduced function with the calculations performed
         """
-        result = Function()
+        # pylint: disable=protected-access
+        results = {}
+        order = self._postorder()
+        count('calculate.nodes', len(order))
+        for node in order:
+            results[node] = node._calculate_node(results, values)
+        return results[self]
+
+    def _calculate_node(self, results: dict, values: dict):
         if self.value in values:
-            result.value = values[self.value]
-            return result
+            return Function.node(values[self.value])
         if self.value in CONSTANTS:
-            result.value = CONSTANTS[self.value]
-            return result
-
-        result.value = self.value
-        if result.value not in OPERATORS:
-            return result
+            return Function.node(CONSTANTS[self.value])
+        if self.value not in OPERATORS:
+            return self
 
-        result.left = self.left.calculate(**values)
-        if OPERATORS[result.value].operator_type == OperatorType.BINARY:
-            result.right = self.right.calculate(**values)
-            if result.value == '/' and result.right.value == 0.0:
+        left = results[self.left]
+        if OPERATORS[self.value].operator_type == OperatorType.BINARY:
+            right = results[self.right]
+            if self.value == '/' and right.value == 0.0:
                 raise ZeroDivisionError
 
-            if isinstance(result.left.value, (int, float)) and \
-                    isinstance(result.right.value, (int, float)):
-                if result.value == '^' and result.left.value == 0.0 \
-                        and result.right.value <= 0:
-                    raise ZeroDivisionError
-                value = OPERATORS[result.value].calculate(
-                    result.left.value, result.right.value)
-                if isinstance(value, complex):
-                    raise ValueError("Argument is out of function domain")
-                result.value = value
-                result.left = result.right = None
-        elif isinstance(result.left.value, (int, float)):
-            if result.value == 'sqrt' and result.left.value < 0.0:
-                raise ValueError("Argument is out of function domain")
-            if result.value == 'ln' and result.left.value <= 0.0:
-                raise ValueError("Argument is out of function domain")
-
-            value = OPERATORS[result.value].calculate(result.left.value)
-            result.value = value
-            result.left = None
-        return result
+            if isinstance(left.value, (int, float)) and \
+                    isinstance(right.value, (int, float)):
+                return Function.node(calculate_operator(
+                    self.value, left.value, right.value))
+            return Function.node(self.value, left, right)
+        if isinstance(left.value, (int, float)):
+            return Function.node(calculate_operator(self.value, left.value))
+        return Function.node(self.value, left)
 
-    def derive(self, variable: str = 'x', **values: dict) -> float:
+    def evaluate(self, **values: dict) -> float:
         """
-        Method that takes derivative of a function\
-            with respect to a given variable and at a given point
+        Method that evaluates a function at a point to a number\
+            without building a reduced function
 
         Args:
-            variable (str, optional): The variable of differentiation.\
-                Defaults to 'x'
-            **values: Positional arguments for function variables.
+            **values: Positional arguments for function variables.\
+                Every variable of the function must be specified
 
         Raises:
-            ValueError: Raises when either a given point is specified\
-                incorrectly or when a derivative does not exists at that point
+            ZeroDivisionError: Raises when division by zero occurs
+            ValueError: Raises when a function receives an argument\
+                that is out of its domain, when the function is undefined\
+                or when not every variable was specified
 
         Returns:
-            float: Derivative of a function at a given point
+            float: Value of the function
         """
-        derivative = self.diff(variable)
-        if self.validate_function(**values) \
-                and derivative.validate_function(**values):
-            value = derivative.calculate(**values).value
-            if not isinstance(value, (int, float)):
-                raise ValueError("Point was not specified correctly")
+        try:
+            return self._evaluate(values)
+        except KeyError as exc:
+            raise ValueError("Point was not specified correctly") from exc
+
+    @profiled('evaluate')
+    def _evaluate(self, values: dict):
+        # pylint: disable=protected-access
+        if self.value is None:
+            raise ValueError("Function is undefined")
+        results = {}
+        order = self._postorder()
+        count('evaluate.nodes', len(order))
+        for node in order:
+            results[node] = node._evaluate_node(results, values)
+        return results[self]
+
+    def _evaluate_node(self, results: dict, values: dict):
+        value = self._value
+        if value in values:
+            return values[value]
+        if value in CONSTANTS:
+            return CONSTANTS[value]
+        if value not in OPERATORS:
+            if isinstance(value, str):
+                raise KeyError(value)
+            if value is None:
+                raise ValueError("Function is undefined")
             return value
-        raise ValueError("Derivative at that point does not exist")
+        if self._right is None:
+            return calculate_operator(value, results[self._left])
+        return calculate_operator(value, results[self._left],
+                                  results[self._right])
 
-    def diff(self, variable: str = 'x'):
+    def compile(self, variables: list = None, check_domain: bool = True):
         """
-        Method that differentiates a function
+        Method that compiles a function to a plain Python callable\
+            for repeated numeric evaluation
 
         Args:
-            variable (str, optional): The variable of differentiation.\
-                Defaults to 'x'
+            variables (list, optional): Names of the callable arguments\
+                in the order they are passed. Defaults to sorted\
+                variables of the function
+            check_domain (bool, optional): If set, the callable performs\
+                the same domain checks as calculate. Defaults to True
 
         Returns:
-            Function: Derivative of a function
+            callable: Compiled function
         """
-        if self.value is None:
-            return Function()
+        # pylint: disable=import-outside-toplevel
+        from .compiler import compile_function
+        return compile_function(self, variables, check_domain)
 
-        derivative = None
-        match self.value:
-            case '+' | '-':
-                derivative = self._diff_sum(variable)
-            case 'unary-':
-                derivative = self._diff_unary_min(variable)
-            case '*':
-                derivative = self._diff_prod(variable)
-            case '/':
-                derivative = self._diff_div(variable)
-            case '^':
-                derivative = self._diff_pow(variable)
-            case 'sqrt':
-                derivative = self._diff_sqrt(variable)
-            case 'exp':
-                derivative = self._diff_exp(variable)
-            case 'ln':
-                derivative = self._diff_ln(variable)
-            case 'sin':
-                derivative = self._diff_sin(variable)
-            case 'cos':
-                derivative = self._diff_cos(variable)
-            case 'tg':
-                derivative = self._diff_tg(variable)
-            case _: derivative = self._diff_var(variable)
-        return derivative.simplify()
-
-    def _diff_sum(self, variable: str):
-        derivative = Function()
-        derivative.value = self.value
-        derivative.left = self.left.diff(variable)
-        derivative.right = self.right.diff(variable)
-        return derivative
-
-    def _diff_unary_min(self, variable: str):
-        derivative = Function()
-        derivative.value = 'unary-'
-        derivative.left = self.left.diff(variable)
-        return derivative
+    def cse(self, prefix: str = 't') -> tuple:
+        """
+        Method that replaces subexpressions occurring in a function\
+            more than once with temporaries
 
-    def _diff_prod(self, variable: str):
-        derivative = Function()
-        derivative.value = '+'
+        Args:
+            prefix (str, optional): Prefix of names of the temporaries.\
+                Defaults to 't'
 
-        derivative.left = Function()
-        derivative.left.value = '*'
-        derivative.left.left = self.left.diff(variable)
-        derivative.left.right = self.right
+        Returns:
+            tuple: List of pairs of names of the temporaries and their\
+                functions and the function written in terms of\
+                the temporaries
+        """
+        # pylint: disable=import-outside-toplevel
+        from .cse import cse
+        return cse(self, prefix)
 
-        derivative.right = Function()
-        derivative.right.value = '*'
-        derivative.right.left = self.left
-        derivative.right.right = self.right.diff(variable)
-        return derivative
+    def evaluate_array(self, **values: dict):
+        """
+        Method that evaluates a function over arrays of points with NumPy
 
-    def _diff_div(self, variable: str):
-        derivative = Function()
-        derivative.value = '/'
+        Args:
+            **values: Positional arguments for function variables.\
+                Values may be arrays of any broadcastable shapes
 
-        derivative.left = Function()
-        derivative.left.value = '-'
+        Raises:
+            ValueError: Raises when the function is undefined\
+                or when not every variable was specified
 
-        derivative.left.left = Function()
-        derivative.left.left.value = '*'
-        derivative.left.left.left = self.left.diff(variable)
-        derivative.left.left.right = self.right
+        Returns:
+            numpy.ma.MaskedArray: Values of the function with points\
+                out of the function domain masked
+        """
+        # pylint: disable=import-outside-toplevel
+        from .vectorize import evaluate_array
+        return evaluate_array(self, **values)
 
-        derivative.left.right = Function()
-        derivative.left.right.value = '*'
-        derivative.left.right.left = self.left
-        derivative.left.right.right = self.right.diff(variable)
+    def derive_array(self, variable: str = 'x', **values: dict):
+        """
+        Method that takes derivative of a function with respect\
+            to a given variable over arrays of points with NumPy
 
-        derivative.right = Function()
-        derivative.right.value = '^'
+        Args:
+            variable (str, optional): The variable of differentiation.\
+                Defaults to 'x'
+            **values: Positional arguments for function variables.\
+                Values may be arrays of any broadcastable shapes
 
-        derivative.right.left = self.right
+        Raises:
+            ValueError: Raises when the function is undefined\
+                or when not every variable was specified
 
-        derivative.right.right = Function()
-        derivative.right.right.value = 2.0
+        Returns:
+            numpy.ma.MaskedArray: Values of the derivative with points\
+                where the derivative does not exist masked
+        """
+        derivative = self.diff(variable).evaluate_array(**values)
+        function = self.evaluate_array(**values)
+        derivative.mask = derivative.mask | function.mask
         return derivative
 
-    def _diff_pow(self, variable: str):
-        derivative = Function()
-        derivative.value = '*'
+    def derive(self, variable: str = 'x', **values: dict) -> float:
+        """
+        Method that takes derivative of a function\
+            with respect to a given variable and at a given point
 
-        derivative.left = Function()
-        derivative.left.value = '+'
+        Args:
+            variable (str, optional): The variable of differentiation.\
+                Defaults to 'x'
+            **values: Positional arguments for function variables.
 
-        derivative.left.left = Function()
-        derivative.left.left.value = '/'
+        Raises:
+            ValueError: Raises when either a given point is specified\
+                incorrectly or when a derivative does not exists at that point
 
-        derivative.left.left.left = Function()
-        derivative.left.left.left.value = '*'
+        Returns:
+            float: Derivative of a function at a given point
+        """
+        # pylint: disable=protected-access
+        derivative = self.diff(variable)
+        if self.validate_function(**values):
+            try:
+                return derivative._evaluate(values)
+            except KeyError as exc:
+                if derivative.validate_function(**values):
+                    raise ValueError(
+                        "Point was not specified correctly") from exc
+            except (ZeroDivisionError, ValueError):
+                pass
+        raise ValueError("Derivative at that point does not exist")
 
-        derivative.left.left.left.left = self.left.diff(variable)
-        derivative.left.left.left.right = self.right
+    def derive_forward(self, variable: str = 'x', **values: dict) -> float:
+        """
+        Method that takes derivative of a function with respect\
+            to a given variable and at a given point with dual numbers,\
+            without building the symbolic derivative
 
-        derivative.left.left.right = self.left
+        Args:
+            variable (str, optional): The variable of differentiation.\
+                Defaults to 'x'
+            **values: Positional arguments for function variables.\
+                Every variable of the function must be specified
 
-        derivative.left.right = Function()
-        derivative.left.right.value = '*'
+        Raises:
+            ValueError: Raises when either a given point is specified\
+                incorrectly or when a derivative does not exists at that point
 
-        derivative.left.right.left = Function()
-        derivative.left.right.left.value = 'ln'
+        Returns:
+            float: Derivative of a function at a given point
+        """
+        # pylint: disable=import-outside-toplevel
+        from .dual import derive_forward
+        return derive_forward(self, variable, **values)
 
-        derivative.left.right.left.left = self.left
+    def gradient(self, **values: dict) -> dict:
+        """
+        Method that takes all partial derivatives of a function\
+            at a given point in a single reverse sweep over the tree
 
-        derivative.left.right.right = self.right.diff(variable)
+        Args:
+            **values: Positional arguments for function variables.\
+                Every variable of the function must be specified
 
-        derivative.right = Function()
-        derivative.right.value = '^'
+        Raises:
+            ValueError: Raises when either a given point is specified\
+                incorrectly or when a derivative does not exists at that point
 
-        derivative.right.left = self.left
-        derivative.right.right = self.right
-        return derivative
+        Returns:
+            dict: Partial derivatives by the names of the specified variables
+        """
+        # pylint: disable=import-outside-toplevel
+        from .gradient import gradient
+        return gradient(self, **values)
 
-    def _diff_sqrt(self, variable: str):
-        derivative = Function()
-        derivative.value = '/'
+    def grad(self, variables: list = None,
+             simplifier: Simplifier = Simplifier.SYMPY) -> dict:
+        """
+        Method that differentiates a function with respect to several\
+            variables at once, sharing their common subexpressions
 
-        derivative.left = self.left.diff(variable)
+        Args:
+            variables (list, optional): The variables of differentiation.\
+                Defaults to sorted variables of the function
+            simplifier (Simplifier, optional): The simplification engine.\
+                Defaults to Simplifier.SYMPY
 
-        derivative.right = Function()
-        derivative.right.value = '*'
+        Returns:
+            dict: Derivatives by the names of the variables
+        """
+        # pylint: disable=import-outside-toplevel
+        from .gradient import grad
+        return grad(self, variables, simplifier)
 
-        derivative.right.left = Function()
-        derivative.right.left.value = 2.0
+    @profiled('diff')
+    def diff(self, variable: str = 'x', deferred: bool = False,
+             simplifier: Simplifier = Simplifier.SYMPY, order: int = 1):
+        """
+        Method that differentiates a function
 
-        derivative.right.right = Function()
-        derivative.right.right.value = 'sqrt'
-        derivative.right.right.left = self.left
-        return derivative
+        Args:
+            variable (str, optional): The variable of differentiation.\
+                Defaults to 'x'
+            deferred (bool, optional): If set, the raw derivative tree\
+                is built first and simplified only once at the root.\
+                Otherwise every intermediate derivative is simplified.\
+                Native simplification is always deferred, because\
+                it normalizes whole subtrees and simplifying every\
+                intermediate derivative would take quadratic time\
+                in the depth of the function. Defaults to False
+            simplifier (Simplifier, optional): The simplification engine.\
+                Defaults to Simplifier.SYMPY
+            order (int, optional): The order of the derivative.\
+                Derivatives of lower orders are simplified natively,\
+                the given engine simplifies only the last one. Defaults to 1
 
-    def _diff_exp(self, variable: str):
-        derivative = Function()
-        derivative.value = '*'
-        derivative.left = self.left.diff(variable)
+        Raises:
+            ValueError: Raises when the order is negative
 
-        derivative.right = Function()
-        derivative.right.value = 'exp'
-        derivative.right.left = self.left
-        return derivative
+        Returns:
+            Function: Derivative of a function
+        """
+        if order < 0:
+            raise ValueError("Order must not be negative")
+        derivative = self
+        intermediate = Simplifier.NONE if simplifier == Simplifier.NONE \
+            else Simplifier.NATIVE
+        for _ in range(order - 1):
+            derivative = derivative.diff(variable, True, intermediate)
+        if order == 0:
+            return derivative
+        if not deferred and simplifier == Simplifier.SYMPY:
+            return derivative._diff(variable, simplifier)
+        key = (derivative, variable, True, simplifier)
+        result = DIFF_CACHE.get(key)
+        if result is None:
+            result = derivative._diff(variable, Simplifier.NONE) \
+                .simplify(simplifier)
+            DIFF_CACHE.put(key, result)
+        return result
 
-    def _diff_ln(self, variable: str):
-        derivative = Function()
-        derivative.value = '/'
-        derivative.left = self.left.diff(variable)
-        derivative.right = self.left
-        return derivative
+    def taylor(self, variable: str = 'x', point: float = 0.0,
+               order: int = 1, **values: dict) -> list:
+        """
+        Method that calculates Taylor coefficients of a function\
+            with truncated power series, without building\
+            symbolic derivatives
+
+        Args:
+            variable (str, optional): The variable of expansion.\
+                Defaults to 'x'
+            point (float, optional): The point of expansion.\
+                Defaults to 0.0
+            order (int, optional): The highest power of the expansion.\
+                Defaults to 1
+            **values: Positional arguments for other function variables.\
+                Every variable of the function must be specified
 
-    def _diff_sin(self, variable: str):
-        derivative = Function()
-        derivative.value = '*'
+        Raises:
+            ValueError: Raises when either the order or a given point\
+                is specified incorrectly or when a derivative does not\
+                exists at that point
 
-        derivative.left = self.left.diff(variable)
+        Returns:
+            list: Coefficients of the powers from 0 to order, the k-th\
+                of them is the k-th derivative divided by k!
+        """
+        # pylint: disable=import-outside-toplevel
+        from .jet import taylor
+        return taylor(self, variable, point, order, **values)
 
-        derivative.right = Function()
-        derivative.right.value = 'cos'
-        derivative.right.left = self.left
+    def _diff(self, variable: str, simplifier: Simplifier):
+        # pylint: disable=protected-access
+        derivatives = {}
+        stack = [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if node in derivatives:
+                continue
+            if node.value is None:
+                derivatives[node] = node
+            elif node.value not in OPERATORS:
+                derivatives[node] = node._diff_var(variable)
+            elif expanded:
+                derivatives[node] = node._diff_node(
+                    derivatives[node.left],
+                    derivatives.get(node.right)).simplify(simplifier)
+                DIFF_CACHE.put((node, variable, False, simplifier),
+                               derivatives[node])
+            else:
+                key = (node, variable, False, simplifier)
+                derivative = DIFF_CACHE.get(key)
+                if derivative is not None:
+                    derivatives[node] = derivative
+                    continue
+                stack.append((node, True))
+                if node.right is not None:
+                    stack.append((node.right, False))
+                stack.append((node.left, False))
+        count('diff.nodes', len(derivatives))
+        return derivatives[self]
+
+    def _diff_node(self, left, right):
+        derivative = None
+        match self.value:
+            case '+' | '-':
+                derivative = self._diff_sum(left, right)
+            case 'unary-':
+                derivative = self._diff_unary_min(left)
+            case '*':
+                derivative = self._diff_prod(left, right)
+            case '/':
+                derivative = self._diff_div(left, right)
+            case '^':
+                derivative = self._diff_pow(left, right)
+            case 'sqrt':
+                derivative = self._diff_sqrt(left)
+            case 'exp':
+                derivative = self._diff_exp(left)
+            case 'ln':
+                derivative = self._diff_ln(left)
+            case 'sin':
+                derivative = self._diff_sin(left)
+            case 'cos':
+                derivative = self._diff_cos(left)
+            case 'tg':
+                derivative = self._diff_tg(left)
         return derivative
 
-    def _diff_cos(self, variable: str):
-        derivative = Function()
-        derivative.value = 'unary-'
+    def _diff_sum(self, left, right):
+        return Function.node(self.value, left, right)
 
-        derivative.left = Function()
-        derivative.left.value = '*'
+    def _diff_unary_min(self, left):
+        return Function.node('unary-', left)
 
-        derivative.left.left = self.left.diff(variable)
+    def _diff_prod(self, left, right):
+        node = Function.node
+        return node('+', node('*', left, self.right),
+                    node('*', self.left, right))
 
-        derivative.left.right = Function()
-        derivative.left.right.value = 'sin'
-        derivative.left.right.left = self.left
-        return derivative
+    def _diff_div(self, left, right):
+        node = Function.node
+        return node('/',
+                    node('-', node('*', left, self.right),
+                         node('*', self.left, right)),
+                    node('^', self.right, node(2.0)))
 
-    def _diff_tg(self, variable: str):
-        derivative = Function()
-        derivative.value = '/'
-        derivative.left = self.left.diff(variable)
+    def _diff_pow(self, left, right):
+        node = Function.node
+        return node('*',
+                    node('+',
+                         node('/', node('*', left, self.right), self.left),
+                         node('*', node('ln', self.left), right)),
+                    node('^', self.left, self.right))
 
-        derivative.right = Function()
-        derivative.right.value = '^'
+    def _diff_sqrt(self, left):
+        node = Function.node
+        return node('/', left,
+                    node('*', node(2.0), node('sqrt', self.left)))
 
-        derivative.right.left = Function()
-        derivative.right.left.value = 'cos'
-        derivative.right.left.left = self.left
+    def _diff_exp(self, left):
+        return Function.node('*', left, Function.node('exp', self.left))
 
-        derivative.right.right = Function()
-        derivative.right.right.value = 2.0
-        return derivative
+    def _diff_ln(self, left):
+        return Function.node('/', left, self.left)
+
+    def _diff_sin(self, left):
+        return Function.node('*', left, Function.node('cos', self.left))
+
+    def _diff_cos(self, left):
+        node = Function.node
+        return node('unary-', node('*', left, node('sin', self.left)))
+
+    def _diff_tg(self, left):
+        node = Function.node
+        return node('/', left, node('^', node('cos', self.left), node(2.0)))
 
     def _diff_var(self, variable: str):
-        derivative = Function()
-        derivative.value = 1.0 if self.value == variable else 0.0
-        return derivative
+        return Function.node(1.0 if self.value == variable else 0.0)
 
+    @profiled('str')
     def __str__(self) -> str:
-        if not self.validate_function():
+        if not self._valid:
             return "undefined"
-        tokens = []
-        self._tokenize_tree(tokens)
-        expr = "".join(map(str, tokens))
-        return expr
+        return "".join(self._tokens())
 
-    def _tokenize_tree(self, tokens: list) -> None:
-        if self.value not in OPERATORS:
-            tokens.append(self.value)
+    @profiled('str')
+    def write(self, stream, chunksize: int = 4096) -> None:
+        """
+        Method that writes a function to a text stream\
+            without building its whole string
+
+        Args:
+            stream: Text stream or any object with a write method
+            chunksize (int, optional): Number of tokens joined\
+                for a single write. Defaults to 4096
+        """
+        if not self._valid:
+            stream.write("undefined")
             return
+        tokens = self._tokens()
+        while chunk := "".join(islice(tokens, chunksize)):
+            stream.write(chunk)
 
-        if OPERATORS[self.value].operator_type == OperatorType.PREFIX:
-            if self.value == 'unary-':
-                tokens.append('-')
+    def _tokens(self):
+        # pylint: disable=protected-access
+        stack = [self]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, Function):
+                stack.extend(reversed(item._node_tokens()))
             else:
-                tokens.append(self.value)
-            self._tree_op_wrapper(self.left, tokens)
-        else:
-            self._tree_op_wrapper(self.left, tokens)
-            tokens.append(self.value)
+                yield str(item)
 
-        if OPERATORS[self.value].operator_type == OperatorType.BINARY:
-            self._tree_op_wrapper(self.right, tokens)
+    def _node_tokens(self) -> list:
+        if self.value not in OPERATORS:
+            return [self.value]
 
-    def _tree_op_wrapper(self, child, tokens: list) -> None:
-        # pylint: disable=protected-access
-        wrap_child_operator = child.value in OPERATORS and \
-            (OPERATORS[self.value].priority
-                > OPERATORS[child.value].priority or
-             (OPERATORS[self.value].priority
-                 == OPERATORS[child.value].priority and
-              ((child == self.right and
-                OPERATORS[self.value].associativity
-                == Associativity.LEFT_ASSOCIATIVE) or
-               (child == self.left and
-                OPERATORS[self.value].associativity
-                == Associativity.RIGHT_ASSOCIATIVE))))
-
-        if OPERATORS[self.value].operator_type != OperatorType.BINARY\
-                or wrap_child_operator:
-            tokens.append('(')
-            child._tokenize_tree(tokens)
-            tokens.append(')')
-        else:
-            child._tokenize_tree(tokens)
+        if OPERATORS[self.value].operator_type == OperatorType.PREFIX:
+            operator = '-' if self.value == 'unary-' else self.value
+            return [operator] + self._tree_op_wrapper(self.left, False)
+        return self._tree_op_wrapper(self.left, False) + [self.value] + \
+            self._tree_op_wrapper(self.right, True)
+
+    def _tree_op_wrapper(self, child, right: bool) -> list:
+        if needs_parentheses(self.value, child.value, right):
+            return ['(', child, ')']
+        return [child]
@@ -0,0 +1,189 @@
+"""Module that provides gradients of functions\
+    computed in a single reverse sweep over the function tree"""
+import math
+from .function import Function, Simplifier
+from .operators import OPERATORS, calculate_operator
+
+
+def gradient(function: Function, **values) -> dict:
+    """
+    Function that takes all partial derivatives of a function\
+        at a given point. Values of the nodes are calculated\
+        in a forward pass and the partial derivatives are accumulated\
+        from the root to the leaves in a single reverse pass
+
+    Args:
+        function (Function): The function to derive
+        **values: Positional arguments for function variables.\
+            Every variable of the function must be specified
+
+    Raises:
+        ValueError: Raises when either a given point is specified\
+            incorrectly or when a derivative does not exists at that point
+
+    Returns:
+        dict: Partial derivatives by the names of the specified variables
+    """
+    # pylint: disable=protected-access
+    if function.value is None:
+        raise ValueError("Derivative at that point does not exist")
+    order = function._postorder()
+    dependent = _dependent_nodes(order, values.keys())
+    results = {}
+    try:
+        for node in order:
+            results[node] = node._evaluate_node(results, values)
+        adjoints = {function: 1.0}
+        for node in reversed(order):
+            if node.value not in OPERATORS or node not in dependent:
+                continue
+            adjoint = adjoints[node]
+            for child, partial in _partials(node, results, dependent):
+                adjoints[child] = adjoints.get(child, 0.0) + adjoint * partial
+    except KeyError as exc:
+        raise ValueError("Point was not specified correctly") from exc
+    except (ZeroDivisionError, ValueError) as exc:
+        raise ValueError("Derivative at that point does not exist") from exc
+    partials = dict.fromkeys(values, 0.0)
+    for node, adjoint in adjoints.items():
+        if node.value in values:
+            partials[node.value] += adjoint
+    return partials
+
+
+def grad(function: Function, variables: list = None,
+         simplifier: Simplifier = Simplifier.SYMPY) -> dict:
+    """
+    Function that differentiates a function with respect to several\
+        variables at once. The derivatives are built in a single reverse\
+        pass, so subexpressions common to several of them are shared
+
+    Args:
+        function (Function): The function to differentiate
+        variables (list, optional): The variables of differentiation.\
+            Defaults to sorted variables of the function
+        simplifier (Simplifier, optional): The simplification engine.\
+            Defaults to Simplifier.SYMPY
+
+    Returns:
+        dict: Derivatives by the names of the variables
+    """
+    # pylint: disable=protected-access
+    if variables is None:
+        variables = sorted(function.variables)
+    if function.value is None:
+        return {variable: function for variable in variables}
+    order = function._postorder()
+    dependent = _dependent_nodes(order, set(variables))
+    node = Function.node
+    adjoints = {function: node(1.0)}
+    for parent in reversed(order):
+        if parent.value not in OPERATORS or parent not in dependent:
+            continue
+        adjoint = adjoints[parent]
+        for child, partial in _symbolic_partials(parent, dependent):
+            contribution = partial if adjoint.value == 1.0 \
+                else node('*', adjoint, partial)
+            adjoints[child] = contribution if child not in adjoints \
+                else node('+', adjoints[child], contribution)
+    return {variable: adjoints.get(node(variable), node(0.0))
+            .simplify(simplifier) for variable in variables}
+
+
+def _dependent_nodes(order: list, variables) -> set:
+    dependent = set()
+    for node in order:
+        if node.value in variables or node.left in dependent or \
+                node.right in dependent:
+            dependent.add(node)
+    return dependent
+
+
+def _partials(node: Function, results: dict, dependent: set) -> list:
+    # pylint: disable=too-many-return-statements
+    u = results[node.left]
+    v = results.get(node.right)
+    match node.value:
+        case '+':
+            partials = [(node.left, 1.0), (node.right, 1.0)]
+        case '-':
+            partials = [(node.left, 1.0), (node.right, -1.0)]
+        case 'unary-':
+            return [(node.left, -1.0)]
+        case '*':
+            partials = [(node.left, v), (node.right, u)]
+        case '/':
+            partials = [(node.left, 1.0 / v), (node.right, -u / v ** 2)]
+        case '^':
+            return _pow_partials(node, results[node], u, v, dependent)
+        case 'sqrt':
+            if results[node] == 0.0:
+                raise ZeroDivisionError
+            return [(node.left, 0.5 / results[node])]
+        case 'exp':
+            return [(node.left, results[node])]
+        case 'ln':
+            return [(node.left, 1.0 / u)]
+        case 'sin':
+            return [(node.left, math.cos(u))]
+        case 'cos':
+            return [(node.left, -math.sin(u))]
+        case 'tg':
+            return [(node.left, 1.0 / math.cos(u) ** 2)]
+    return [(child, partial) for child, partial in partials
+            if child in dependent]
+
+
+def _pow_partials(node: Function, result: float, u: float, v: float,
+                  dependent: set) -> list:
+    partials = []
+    if node.left in dependent:
+        partials.append((node.left, 1.0 if v == 1.0 and
+                         node.right not in dependent
+                         else v * calculate_operator('^', u, v - 1.0)))
+    if node.right in dependent:
+        if u <= 0.0:
+            raise ValueError("Argument is out of function domain")
+        partials.append((node.right, result * math.log(u)))
+    return partials
+
+
+def _symbolic_partials(parent: Function, dependent: set) -> list:
+    # pylint: disable=too-many-return-statements
+    node = Function.node
+    left, right = parent.left, parent.right
+    match parent.value:
+        case '+':
+            partials = [(left, node(1.0)), (right, node(1.0))]
+        case '-':
+            partials = [(left, node(1.0)), (right, node(-1.0))]
+        case 'unary-':
+            return [(left, node(-1.0))]
+        case '*':
+            partials = [(left, right), (right, left)]
+        case '/':
+            partials = [(left, node('/', node(1.0), right)),
+                        (right, node('unary-', node('/', left,
+                                                    node('^', right,
+                                                         node(2.0)))))]
+        case '^':
+            partials = [(left, node('*', right,
+                                    node('^', left,
+                                         node('-', right, node(1.0))))),
+                        (right, node('*', node('ln', left), parent))]
+        case 'sqrt':
+            return [(left, node('/', node(1.0),
+                                node('*', node(2.0), parent)))]
+        case 'exp':
+            return [(left, parent)]
+        case 'ln':
+            return [(left, node('/', node(1.0), left))]
+        case 'sin':
+            return [(left, node('cos', left))]
+        case 'cos':
+            return [(left, node('unary-', node('sin', left)))]
+        case 'tg':
+            return [(left, node('/', node(1.0),
+                                node('^', node('cos', left), node(2.0))))]
+    return [(child, partial) for child, partial in partials
+            if child in dependent]
@@ -0,0 +1,188 @@
+"""Module that provides Taylor coefficients of functions\
+    with truncated power series (jet) arithmetic"""
+import math
+from .function import Function
+from .operators import OPERATORS, CONSTANTS, calculate_operator
+
+
+def taylor(function: Function, variable: str = 'x', point: float = 0.0,
+           order: int = 1, **values) -> list:
+    """
+    Function that calculates Taylor coefficients of a function\
+        with respect to a given variable and at a given point.\
+        Every node of the function tree is evaluated to a truncated power\
+        series, which takes O(order^2) operations per node
+
+    Args:
+        function (Function): The function to expand
+        variable (str, optional): The variable of expansion.\
+            Defaults to 'x'
+        point (float, optional): The point of expansion. Defaults to 0.0
+        order (int, optional): The highest power of the expansion.\
+            Defaults to 1
+        **values: Positional arguments for other function variables.\
+            Every variable of the function must be specified
+
+    Raises:
+        ValueError: Raises when either the order or a given point\
+            is specified incorrectly or when a derivative does not exists\
+            at that point
+
+    Returns:
+        list: Coefficients of the powers from 0 to order, the k-th of them\
+            is the k-th derivative divided by k!
+    """
+    # pylint: disable=protected-access
+    if order < 0:
+        raise ValueError("Order must not be negative")
+    if function.value is None:
+        raise ValueError("Derivative at that point does not exist")
+    values = values | {variable: point}
+    jets = {}
+    try:
+        for node in function._postorder():
+            jets[node] = _jet(node, jets, variable, values, order)
+    except KeyError as exc:
+        raise ValueError("Point was not specified correctly") from exc
+    except (ZeroDivisionError, ValueError) as exc:
+        raise ValueError("Derivative at that point does not exist") from exc
+    return _lift(jets[function], order)
+
+
+def _jet(node: Function, jets: dict, variable: str, values: dict,
+         order: int):
+    value = node.value
+    if value not in OPERATORS:
+        if value == variable:
+            return _lift(values[value], order, 1.0)
+        if value in values:
+            return values[value]
+        if value in CONSTANTS:
+            return CONSTANTS[value]
+        if isinstance(value, str):
+            raise KeyError(value)
+        return value
+
+    left = jets[node.left]
+    right = jets.get(node.right)
+    if not isinstance(left, list) and not isinstance(right, list):
+        if right is None:
+            return calculate_operator(value, left)
+        return calculate_operator(value, left, right)
+    if value == '^':
+        return _pow(left, right, order)
+
+    u = _lift(left, order)
+    v = None if right is None else _lift(right, order)
+    result = calculate_operator(value, u[0]) if v is None \
+        else calculate_operator(value, u[0], v[0])
+    return _series(value, result, u, v, order)
+
+
+def _series(operator: str, result: float, u: list, v: list,
+            order: int) -> list:
+    # pylint: disable=too-many-return-statements
+    match operator:
+        case '+':
+            return [a + b for a, b in zip(u, v)]
+        case '-':
+            return [a - b for a, b in zip(u, v)]
+        case 'unary-':
+            return [-a for a in u]
+        case '*':
+            return _mul(u, v, order)
+        case '/':
+            return _div(u, v, result, order)
+        case 'sqrt':
+            return _sqrt(u, result, order)
+        case 'exp':
+            return _exp(u, result, order)
+        case 'ln':
+            return _ln(u, result, order)
+        case 'sin':
+            return _sin_cos(u, order)[0]
+        case 'cos':
+            return _sin_cos(u, order)[1]
+        case 'tg':
+            sin, cos = _sin_cos(u, order)
+            return _div(sin, cos, result, order)
+    raise ValueError(f"Unknown operator '{operator}'")
+
+
+def _lift(jet, order: int, slope: float = 0.0) -> list:
+    if isinstance(jet, list):
+        return jet
+    return ([jet, slope] + [0.0] * (order - 1))[:order + 1]
+
+
+def _mul(u: list, v: list, order: int) -> list:
+    return [sum(u[j] * v[k - j] for j in range(k + 1))
+            for k in range(order + 1)]
+
+
+def _div(u: list, v: list, result: float, order: int) -> list:
+    w = [result]
+    for k in range(1, order + 1):
+        w.append((u[k] - sum(v[j] * w[k - j]
+                             for j in range(1, k + 1))) / v[0])
+    return w
+
+
+def _sqrt(u: list, result: float, order: int) -> list:
+    if order and result == 0.0:
+        raise ZeroDivisionError
+    w = [result]
+    for k in range(1, order + 1):
+        w.append((u[k] - sum(w[j] * w[k - j]
+                             for j in range(1, k))) / (2 * result))
+    return w
+
+
+def _exp(u: list, result: float, order: int) -> list:
+    w = [result]
+    for k in range(1, order + 1):
+        w.append(sum(j * u[j] * w[k - j] for j in range(1, k + 1)) / k)
+    return w
+
+
+def _ln(u: list, result: float, order: int) -> list:
+    w = [result]
+    for k in range(1, order + 1):
+        w.append((u[k] - sum(j * w[j] * u[k - j]
+                             for j in range(1, k)) / k) / u[0])
+    return w
+
+
+def _sin_cos(u: list, order: int) -> tuple:
+    sin, cos = [math.sin(u[0])], [math.cos(u[0])]
+    for k in range(1, order + 1):
+        sin.append(sum(j * u[j] * cos[k - j] for j in range(1, k + 1)) / k)
+        cos.append(-sum(j * u[j] * sin[k - j] for j in range(1, k + 1)) / k)
+    return sin, cos
+
+
+def _pow(base, exponent, order: int) -> list:
+    if isinstance(exponent, list):
+        base = _lift(base, order)
+        if base[0] <= 0.0:
+            raise ValueError("Argument is out of function domain")
+        log = _ln(base, math.log(base[0]), order)
+        product = _mul(log, exponent, order)
+        return _exp(product, calculate_operator('^', base[0], exponent[0]),
+                    order)
+
+    result = calculate_operator('^', base[0], exponent)
+    if base[0] != 0.0:
+        w = [result]
+        for k in range(1, order + 1):
+            w.append(sum(((exponent + 1) * j - k) * base[j] * w[k - j]
+                         for j in range(1, k + 1)) / (k * base[0]))
+        return w
+    if not float(exponent).is_integer():
+        if order:
+            raise ZeroDivisionError
+        return [result]
+    w = _lift(1.0, order)
+    for _ in range(int(exponent)):
+        w = _mul(w, base, order)
+    return w
@@ -117,3 +117,62 @@ CONSTANTS = {
     'tau': math.tau,
     'phi': (1 + math.sqrt(5)) / 2,
 }
+
+
+def calculate_operator(token: str, *args) -> float:
+    """
+    Function that calculates result of the operator with given arguments\
+        and performs the same domain checks as Function.calculate
+
+    Args:
+        token (str): The operator token
+        *args: Numeric arguments for the operator
+
+    Raises:
+        ZeroDivisionError: Raises when division by zero occurs
+        ValueError: Raises when the operator receives\
+            an argument that is out of its domain
+
+    Returns:
+        float: Result of the operator
+    """
+    if token == '/' and args[1] == 0.0:
+        raise ZeroDivisionError
+    if token == '^' and args[0] == 0.0 and args[1] <= 0:
+        raise ZeroDivisionError
+    if token == 'sqrt' and args[0] < 0.0:
+        raise ValueError("Argument is out of function domain")
+    if token == 'ln' and args[0] <= 0.0:
+        raise ValueError("Argument is out of function domain")
+    value = OPERATORS[token].calculate(*args)
+    if isinstance(value, complex):
+        raise ValueError("Argument is out of function domain")
+    return value
+
+
+def needs_parentheses(operator: str, operand, right: bool) -> bool:
+    """
+    Function that checks if an operand of an operator\
+        must be wrapped in parentheses when written
+
+    Args:
+        operator (str): The operator token
+        operand: Operator token, variable name or number of the operand
+        right (bool): Whether the operand is the right one
+
+    Returns:
+        bool: Whether the operand must be wrapped in parentheses
+    """
+    parent = OPERATORS[operator]
+    if parent.operator_type != OperatorType.BINARY:
+        return True
+    if operand in OPERATORS:
+        child = OPERATORS[operand]
+        return parent.priority > child.priority or \
+            parent.priority == child.priority and \
+            (right and parent.associativity ==
+             Associativity.LEFT_ASSOCIATIVE or
+             not right and parent.associativity ==
+             Associativity.RIGHT_ASSOCIATIVE)
+    return isinstance(operand, (int, float)) and operand < 0 and \
+        (right or parent.priority >= 2)
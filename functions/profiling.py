@@ -0,0 +1,151 @@
+"""Module that provides opt-in profiling of parsing, differentiation,\
+    simplification, calculation and serialization"""
+from contextlib import contextmanager
+from functools import wraps
+from threading import Lock
+from time import perf_counter
+
+_ACTIVE = None
+
+
+class Profile:
+    """
+    Class that collects wall time and number of calls of stages\
+        and arbitrary counters
+    """
+
+    def __init__(self) -> None:
+        self._stages = {}
+        self._counters = {}
+        self._depths = {}
+        self._lock = Lock()
+
+    def enter(self, stage: str) -> bool:
+        """
+        Method that registers a call of a stage
+
+        Args:
+            stage (str): Name of the stage
+
+        Returns:
+            bool: Whether the call is not nested in another call\
+                of the same stage and its time should be recorded
+        """
+        with self._lock:
+            depth = self._depths.get(stage, 0)
+            self._depths[stage] = depth + 1
+            record = self._stages.setdefault(stage, [0, 0.0])
+            record[0] += 1
+            return depth == 0
+
+    def exit(self, stage: str, seconds: float = None) -> None:
+        """
+        Method that registers the end of a call of a stage
+
+        Args:
+            stage (str): Name of the stage
+            seconds (float, optional): Wall time of the call\
+                to add to the stage. Defaults to None
+        """
+        with self._lock:
+            self._depths[stage] -= 1
+            if seconds is not None:
+                self._stages[stage][1] += seconds
+
+    def count(self, counter: str, number: int = 1) -> None:
+        """
+        Method that increases a counter
+
+        Args:
+            counter (str): Name of the counter
+            number (int, optional): The increment. Defaults to 1
+        """
+        with self._lock:
+            self._counters[counter] = self._counters.get(counter, 0) + number
+
+    def as_dict(self) -> dict:
+        """
+        Method that exports collected statistics
+
+        Returns:
+            dict: Number of calls and wall time in seconds of every stage\
+                and values of the counters
+        """
+        with self._lock:
+            return {'stages': {stage: {'calls': calls, 'seconds': seconds}
+                               for stage, (calls, seconds)
+                               in self._stages.items()},
+                    'counters': dict(self._counters)}
+
+    def summary(self) -> str:
+        """
+        Method that describes collected statistics as text
+
+        Returns:
+            str: One line for every stage and every counter
+        """
+        statistics = self.as_dict()
+        lines = [f"{stage:<12}{record['calls']:>10} calls"
+                 f"{record['seconds'] * 1000:>12.3f} ms"
+                 for stage, record in statistics['stages'].items()]
+        lines += [f"{counter:<24}{number:>10}"
+                  for counter, number in statistics['counters'].items()]
+        return "\n".join(lines)
+
+
+@contextmanager
+def profile():
+    """
+    Context manager that collects statistics of the code in its body
+
+    Yields:
+        Profile: The collected statistics
+    """
+    global _ACTIVE  # pylint: disable=global-statement
+    previous = _ACTIVE
+    _ACTIVE = Profile()
+    try:
+        yield _ACTIVE
+    finally:
+        _ACTIVE = previous
+
+
+def profiled(stage: str):
+    """
+    Decorator that records wall time and calls of a function\
+        as a stage while profiling is active. Otherwise only checks\
+        whether it is active
+
+    Args:
+        stage (str): Name of the stage
+
+    Returns:
+        callable: The decorator
+    """
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            active = _ACTIVE
+            if active is None:
+                return function(*args, **kwargs)
+            outermost = active.enter(stage)
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                active.exit(stage, perf_counter() - start
+                            if outermost else None)
+        return wrapper
+    return decorator
+
+
+def count(counter: str, number: int = 1) -> None:
+    """
+    Function that increases a counter while profiling is active
+
+    Args:
+        counter (str): Name of the counter
+        number (int, optional): The increment. Defaults to 1
+    """
+    if _ACTIVE is not None:
+        _ACTIVE.count(counter, number)
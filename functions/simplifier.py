@@ -0,0 +1,260 @@
+"""Module that provides native simplification of mathematical functions"""
+from .function import Function
+from .operators import OPERATORS, OperatorType, calculate_operator
+
+_node = Function.node
+
+SUM_OPERATORS = ('+', '-', 'unary-')
+PRODUCT_OPERATORS = ('*', '/')
+
+
+def simplify_native(function: Function) -> Function:
+    """
+    Function that simplifies a function by working directly\
+        on its tree, without SymPy. Performs constant folding,\
+        elimination of identities and annihilators,\
+        collecting of like terms and combining of powers
+
+    Args:
+        function (Function): The function to simplify
+
+    Returns:
+        Function: Simplified function
+    """
+    # pylint: disable=protected-access
+    order = function._postorder()
+    absorbed = _absorbed_nodes(order)
+    results = {}
+    for node in order:
+        results[node] = _simplify(node, results, node in absorbed)
+    return results[function][0]
+
+
+def _absorbed_nodes(order: list) -> set:
+    absorbed = {}
+    for node in order:
+        for child in (node.left, node.right):
+            if child is not None:
+                absorbs = (node.value in SUM_OPERATORS and
+                           child.value in SUM_OPERATORS) or \
+                    (node.value in PRODUCT_OPERATORS and
+                     child.value in PRODUCT_OPERATORS + ('unary-',))
+                absorbed[child] = absorbed.get(child, True) and absorbs
+    return {node for node, absorbs in absorbed.items() if absorbs}
+
+
+def _simplify(node: Function, results: dict, absorbed: bool) -> tuple:
+    if node.value is None:
+        return node, False
+    if node.value not in OPERATORS:
+        return node, True
+
+    left, valid = results[node.left]
+    if OPERATORS[node.value].operator_type != OperatorType.BINARY:
+        if absorbed and not _is_number(left):
+            return _node(node.value, left), valid
+        return _simplify_prefix(node.value, left, valid)
+
+    right, right_valid = results[node.right]
+    if absorbed and not (_is_number(left) and _is_number(right)):
+        return _node(node.value, left, right), valid and right_valid
+    return _simplify_binary(node.value, left, right, valid and right_valid)
+
+
+def _simplify_prefix(operator: str, child: Function, valid: bool) -> tuple:
+    if _is_number(child):
+        return _fold(operator, child)
+    if operator == 'unary-':
+        if child.value == 'unary-':
+            return child.left, valid
+        if valid:
+            return _canonical_sum(_node(operator, child)), valid
+    return _node(operator, child), valid
+
+
+def _simplify_binary(operator: str, left: Function,
+                     right: Function, valid: bool) -> tuple:
+    if _is_number(left) and _is_number(right):
+        return _fold(operator, left, right)
+
+    node = _node(operator, left, right)
+    if valid and operator in ('+', '-'):
+        return _canonical_sum(node), valid
+    if valid and operator in ('*', '/'):
+        canonical = _canonical_product(node)
+        if canonical is not None:
+            return canonical, valid
+
+    match operator:
+        case '+':
+            if _is_number(left, 0):
+                return right, valid
+            if _is_number(right, 0):
+                return left, valid
+        case '-':
+            if _is_number(right, 0):
+                return left, valid
+            if _is_number(left, 0):
+                return _simplify_prefix('unary-', right, valid)
+        case '*':
+            if valid and (_is_number(left, 0) or _is_number(right, 0)):
+                return _node(0.0), valid
+            if _is_number(left, 1):
+                return right, valid
+            if _is_number(right, 1):
+                return left, valid
+        case '/':
+            if _is_number(right, 1):
+                return left, valid
+            if valid and _is_number(left, 0):
+                return _node(0.0), valid
+        case '^':
+            if _is_number(right, 1):
+                return left, valid
+            if valid and (_is_number(right, 0) or _is_number(left, 1)):
+                return _node(1.0), valid
+    return node, valid
+
+
+def _canonical_sum(node: Function) -> Function:
+    terms = {}
+    constant = 0.0
+    for sign, term in _collect_terms(node, 1.0):
+        if _is_number(term):
+            constant += sign * term.value
+            continue
+        product = _collect_factors(term)
+        if product is None:
+            coefficient, factors = 1.0, [[term, 1.0]]
+        else:
+            coefficient, factors = product
+        if not factors:
+            constant += sign * coefficient
+            continue
+        key = frozenset((base, exponent) for base, exponent in factors)
+        if key in terms:
+            terms[key][0] += sign * coefficient
+        else:
+            terms[key] = [sign * coefficient, factors]
+
+    terms = list(terms.values()) + [[constant, []]]
+    terms = [term for term in terms if term[0] != 0] or [[0.0, []]]
+    terms.sort(key=lambda term: term[0] < 0)
+    result = _build_product(*terms[0])
+    for coefficient, factors in terms[1:]:
+        if coefficient < 0:
+            result = _node('-', result, _build_product(-coefficient, factors))
+        else:
+            result = _node('+', result, _build_product(coefficient, factors))
+    return result
+
+
+def _collect_terms(node: Function, sign: float) -> list:
+    terms = []
+    stack = [(node, sign)]
+    while stack:
+        term, sign = stack.pop()
+        match term.value:
+            case '+':
+                stack.append((term.right, sign))
+                stack.append((term.left, sign))
+            case '-':
+                stack.append((term.right, -sign))
+                stack.append((term.left, sign))
+            case 'unary-':
+                stack.append((term.left, -sign))
+            case _:
+                terms.append((sign, term))
+    return terms
+
+
+def _canonical_product(node: Function) -> Function:
+    product = _collect_factors(node)
+    if product is None:
+        return None
+    return _build_product(*product)
+
+
+def _collect_factors(node: Function) -> tuple:
+    coefficient = 1.0
+    factors = {}
+    stack = [(node, 1.0)]
+    while stack:
+        factor, sign = stack.pop()
+        match factor.value:
+            case '*':
+                stack.append((factor.right, sign))
+                stack.append((factor.left, sign))
+                continue
+            case '/':
+                stack.append((factor.right, -sign))
+                stack.append((factor.left, sign))
+                continue
+            case 'unary-':
+                coefficient = -coefficient
+                stack.append((factor.left, sign))
+                continue
+        if _is_number(factor):
+            if sign < 0 and factor.value == 0:
+                return None
+            coefficient *= factor.value if sign > 0 else 1 / factor.value
+            continue
+        base, exponent = factor, 1.0
+        if factor.value == '^' and _is_number(factor.right):
+            base, exponent = factor.left, factor.right.value
+        while base.value == '^' and _is_number(base.right) and \
+                float(exponent).is_integer():
+            base, exponent = base.left, exponent * base.right.value
+        if base in factors:
+            factors[base][1] += sign * exponent
+        else:
+            factors[base] = [base, sign * exponent]
+    if coefficient == 0:
+        return 0.0, []
+    return coefficient, [factor for factor in factors.values() if factor[1]]
+
+
+def _build_product(coefficient: float, factors: list) -> Function:
+    numerator = [_power(base, exponent)
+                 for base, exponent in factors if exponent > 0]
+    denominator = [_power(base, -exponent)
+                   for base, exponent in factors if exponent < 0]
+    if coefficient == -1 and numerator:
+        return _node('unary-', _build_product(1.0, factors))
+    if coefficient != 1 or not numerator:
+        numerator.insert(0, _node(coefficient + 0.0))
+
+    result = _chain(numerator)
+    if denominator:
+        result = _node('/', result, _chain(denominator))
+    return result
+
+
+def _chain(factors: list) -> Function:
+    result = factors[0]
+    for factor in factors[1:]:
+        result = _node('*', result, factor)
+    return result
+
+
+def _power(base: Function, exponent: float) -> Function:
+    if exponent == 1:
+        return base
+    return _node('^', base, _node(exponent + 0.0))
+
+
+def _fold(operator: str, *operands: Function) -> tuple:
+    try:
+        value = calculate_operator(operator,
+                                   *(operand.value for operand in operands))
+    except (ZeroDivisionError, ValueError):
+        return _node(operator, *operands), False
+    except OverflowError:
+        return _node(operator, *operands), True
+    return _node(value + 0.0), True
+
+
+def _is_number(node: Function, number: float = None) -> bool:
+    if not isinstance(node.value, (int, float)):
+        return False
+    return number is None or node.value == number
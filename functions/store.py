@@ -0,0 +1,253 @@
+"""Module that provides a persistent memory-mapped store of derivatives"""
+import hashlib
+import mmap
+import os
+import struct
+from .binary import dumps, loads
+from .expr_parser import Parser
+from .flat import FlatFunction
+
+DATA_MAGIC = b'DRSD'
+INDEX_MAGIC = b'DRSI'
+RECORD = struct.Struct('<III')
+INDEX_HEADER = struct.Struct('<4s4xQQ')
+SLOT = struct.Struct('<QQ')
+
+
+class DerivativeStore:
+    """
+    Class that stores derivatives of functions on disk.\
+        Records are appended to a data file and found through an open\
+        addressing hash table in an index file. Both files are memory\
+        mapped, so processes that open the same store share its pages.\
+        A store may have a single writer and any number of readers
+
+    Args:
+        path (str): Path of the data file, the index file has\
+            the same path with the '.idx' suffix
+        writable (bool, optional): If set, the store is created\
+            if it does not exist and derivatives may be added to it.\
+            Defaults to False
+        capacity (int, optional): Initial number of slots of the index\
+            of a new store, a power of two. Defaults to 1024
+    """
+
+    def __init__(self, path: str, writable: bool = False,
+                 capacity: int = 1024) -> None:
+        self._path = path
+        self._index_path = path + '.idx'
+        self._writable = writable
+        self._data = None
+        self._index = None
+        self._index_stat = None
+        if writable and not os.path.exists(path):
+            with open(path, 'wb') as stream:
+                stream.write(DATA_MAGIC)
+            self._write_index(self._index_path, capacity, [])
+        self._open()
+
+    @property
+    def path(self) -> str:
+        """
+        Property that contains path of the data file
+
+        Returns:
+            str: Path of the data file
+        """
+        return self._path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return INDEX_HEADER.unpack_from(self._index)[2]
+
+    def __contains__(self, key: tuple) -> bool:
+        return self._find(*key) is not None
+
+    def close(self) -> None:
+        """
+        Method that unmaps the files of the store. Files that are still\
+            used by flat functions returned by get_function are unmapped\
+            when the functions are deleted
+        """
+        for mapped in (self._data, self._index):
+            if mapped is None:
+                continue
+            try:
+                mapped.close()
+            except BufferError:
+                pass
+        self._data = self._index = None
+
+    def get(self, expression: str, variable: str = 'x') -> str:
+        """
+        Method that returns the stored derivative of a function
+
+        Args:
+            expression (str): The function
+            variable (str, optional): The variable of differentiation.\
+                Defaults to 'x'
+
+        Returns:
+            str: The derivative or None if it is not stored
+        """
+        record = self._find(expression, variable)
+        if record is None:
+            return None
+        value, _ = record
+        return bytes(value).decode('utf-8')
+
+    def get_function(self, expression: str,
+                     variable: str = 'x') -> FlatFunction:
+        """
+        Method that returns the stored derivative of a function\
+            as a flat function, without copying or parsing it
+
+        Args:
+            expression (str): The function
+            variable (str, optional): The variable of differentiation.\
+                Defaults to 'x'
+
+        Returns:
+            FlatFunction: The derivative or None if it is not stored\
+                or was stored without its tree
+        """
+        record = self._find(expression, variable)
+        if record is None or not record[1]:
+            return None
+        return loads(record[1])
+
+    def put(self, expression: str, variable: str, derivative: str,
+            function=None) -> None:
+        """
+        Method that appends a derivative of a function to the store.\
+            A derivative that is already stored is not replaced
+
+        Args:
+            expression (str): The function
+            variable (str): The variable of differentiation
+            derivative (str): The derivative
+            function (Function, optional): Tree of the derivative\
+                to store in the binary format. Defaults to None
+
+        Raises:
+            PermissionError: Raises when the store is not writable
+        """
+        if not self._writable:
+            raise PermissionError("Store is opened read-only")
+        if self._find(expression, variable) is not None:
+            return
+        key = _key(expression, variable)
+        value = derivative.encode('utf-8')
+        blob = b"" if function is None else dumps(function)
+        with open(self._path, 'ab') as stream:
+            offset = stream.tell()
+            stream.write(RECORD.pack(len(key), len(value), len(blob)))
+            stream.write(key + value + blob)
+
+        _, capacity, count = INDEX_HEADER.unpack_from(self._index)
+        if 2 * (count + 1) > capacity:
+            slots = [slot for slot in self._slots() if slot[0]]
+            slots.append((_hash(key), offset))
+            self._write_index(self._index_path, 2 * capacity, slots)
+            self._open()
+            return
+        self._insert(self._index, capacity, _hash(key), offset)
+        INDEX_HEADER.pack_into(self._index, 0, INDEX_MAGIC, capacity,
+                               count + 1)
+
+    def _open(self) -> None:
+        self.close()
+        access = mmap.ACCESS_WRITE if self._writable else mmap.ACCESS_READ
+        with open(self._index_path, 'r+b' if self._writable else 'rb') \
+                as stream:
+            self._index = mmap.mmap(stream.fileno(), 0, access=access)
+            self._index_stat = os.fstat(stream.fileno())
+        self._map_data()
+        if self._index[:4] != INDEX_MAGIC or self._data[:4] != DATA_MAGIC:
+            raise ValueError("Invalid derivative store")
+
+    def _map_data(self) -> None:
+        with open(self._path, 'rb') as stream:
+            self._data = mmap.mmap(stream.fileno(), 0,
+                                   access=mmap.ACCESS_READ)
+
+    def _find(self, expression: str, variable: str) -> tuple:
+        key = _key(expression, variable)
+        record = self._lookup(key)
+        if record is None and not self._writable and self._changed():
+            self._open()
+            record = self._lookup(key)
+        return record
+
+    def _lookup(self, key: bytes) -> tuple:
+        _, capacity, _ = INDEX_HEADER.unpack_from(self._index)
+        key_hash = _hash(key)
+        slot = key_hash & (capacity - 1)
+        while True:
+            stored_hash, offset = SLOT.unpack_from(
+                self._index, INDEX_HEADER.size + SLOT.size * slot)
+            if not stored_hash:
+                return None
+            if stored_hash == key_hash:
+                record = self._record(offset)
+                if record[0] == key:
+                    return record[1:]
+            slot = (slot + 1) & (capacity - 1)
+
+    def _record(self, offset: int) -> tuple:
+        if offset + RECORD.size > len(self._data):
+            self._map_data()
+        key_length, value_length, blob_length = \
+            RECORD.unpack_from(self._data, offset)
+        start = offset + RECORD.size
+        end = start + key_length + value_length + blob_length
+        if end > len(self._data):
+            self._map_data()
+        view = memoryview(self._data)[start:end]
+        return (view[:key_length], view[key_length:key_length + value_length],
+                view[key_length + value_length:])
+
+    def _changed(self) -> bool:
+        stat = os.stat(self._index_path)
+        return (stat.st_ino, stat.st_mtime_ns) != \
+            (self._index_stat.st_ino, self._index_stat.st_mtime_ns)
+
+    def _slots(self):
+        _, capacity, _ = INDEX_HEADER.unpack_from(self._index)
+        for slot in range(capacity):
+            yield SLOT.unpack_from(self._index,
+                                   INDEX_HEADER.size + SLOT.size * slot)
+
+    @staticmethod
+    def _insert(index, capacity: int, key_hash: int, offset: int) -> None:
+        slot = key_hash & (capacity - 1)
+        while SLOT.unpack_from(index, INDEX_HEADER.size + SLOT.size * slot)[0]:
+            slot = (slot + 1) & (capacity - 1)
+        position = INDEX_HEADER.size + SLOT.size * slot
+        struct.pack_into('<Q', index, position + 8, offset)
+        struct.pack_into('<Q', index, position, key_hash)
+
+    @classmethod
+    def _write_index(cls, path: str, capacity: int, slots: list) -> None:
+        index = bytearray(INDEX_HEADER.size + SLOT.size * capacity)
+        INDEX_HEADER.pack_into(index, 0, INDEX_MAGIC, capacity, len(slots))
+        for key_hash, offset in slots:
+            cls._insert(index, capacity, key_hash, offset)
+        temporary = path + '.tmp'
+        with open(temporary, 'wb') as stream:
+            stream.write(index)
+        os.replace(temporary, path)
+
+
+def _key(expression: str, variable: str) -> bytes:
+    return f"{variable}\0{Parser(expression).expression}".encode('utf-8')
+
+
+def _hash(key: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(),
+                          'little') or 1
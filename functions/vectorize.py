@@ -0,0 +1,96 @@
+"""Module that provides vectorized evaluation of functions with NumPy"""
+import numpy as np
+from .function import Function
+from .operators import OPERATORS, CONSTANTS
+
+UFUNCS = {
+    '+': np.add,
+    '-': np.subtract,
+    'unary-': np.negative,
+    '*': np.multiply,
+    '/': np.true_divide,
+    '^': np.power,
+    'sqrt': np.sqrt,
+    'exp': np.exp,
+    'ln': np.log,
+    'sin': np.sin,
+    'cos': np.cos,
+    'tg': np.tan,
+}
+
+
+def evaluate_array(function: Function, **values) -> np.ma.MaskedArray:
+    """
+    Function that evaluates a function over arrays of points
+
+    Args:
+        function (Function): The function to evaluate
+        **values: Positional arguments for function variables.\
+            Values may be arrays of any broadcastable shapes
+
+    Raises:
+        ValueError: Raises when the function is undefined\
+            or when not every variable was specified
+
+    Returns:
+        np.ma.MaskedArray: Values of the function. Points where\
+            Function.calculate would raise ZeroDivisionError\
+            or ValueError are masked
+    """
+    if function.value is None:
+        raise ValueError("Function is undefined")
+    if not function.variables <= values.keys():
+        raise ValueError("Point was not specified correctly")
+
+    values = {name: np.asarray(value, dtype=float)
+              for name, value in values.items()}
+    shape = np.broadcast_shapes(*(value.shape for value in values.values()))
+    mask = np.zeros(shape, dtype=bool)
+    results = {}
+    stack = [(function, False)]
+    with np.errstate(all='ignore'):
+        while stack:
+            node, visited = stack.pop()
+            if id(node) in results:
+                continue
+            if node.value not in OPERATORS:
+                results[id(node)] = _leaf(node.value, values)
+                continue
+            if not visited:
+                stack.append((node, True))
+                if node.right is not None:
+                    stack.append((node.right, False))
+                stack.append((node.left, False))
+                continue
+
+            operands = [results[id(node.left)]]
+            if node.right is not None:
+                operands.append(results[id(node.right)])
+            mask |= _domain_errors(node.value, *operands)
+            results[id(node)] = UFUNCS[node.value](*operands)
+
+    result = np.broadcast_to(results[id(function)], shape)
+    return np.ma.masked_array(result, mask=mask)
+
+
+def _leaf(value, values: dict) -> np.ndarray:
+    if value in values:
+        return values[value]
+    if value in CONSTANTS:
+        return np.float64(CONSTANTS[value])
+    return np.float64(value)
+
+
+def _domain_errors(operator: str, *operands: np.ndarray) -> np.ndarray:
+    match operator:
+        case '/':
+            return operands[1] == 0.0
+        case '^':
+            base, exponent = operands
+            return (base == 0.0) & (exponent <= 0) | \
+                (base < 0.0) & (exponent != np.floor(exponent))
+        case 'sqrt':
+            return operands[0] < 0.0
+        case 'ln':
+            return operands[0] <= 0.0
+    return np.False_
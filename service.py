@@ -0,0 +1,414 @@
+"""Module that provides an asyncio front-end for taking derivatives\
+    with request batching and a JSON Lines server"""
+import argparse
+import asyncio
+import json
+import sys
+import derivative
+from derivative import DiffResult, describe_error
+
+
+class DiffError(Exception):
+    """
+    Exception raised when a derivative could not be taken by a service
+
+    Args:
+        description (dict): Description of the error\
+            made by derivative.describe_error
+    """
+
+    def __init__(self, description: dict) -> None:
+        details = ", ".join(f"{key}={value}"
+                            for key, value in description.items()
+                            if key != 'error')
+        super().__init__(f"{description['error']}: {details}")
+        self.description = description
+
+
+class DiffService:
+    """
+    Class that takes derivatives for coroutines without blocking\
+        the event loop. Concurrent requests are collected into batches,\
+        identical requests of a batch are computed once and batches are\
+        computed in an executor
+
+    Args:
+        executor (Executor, optional): Executor that computes batches,\
+            the default executor of the event loop if None.\
+            Defaults to None
+        batch_size (int, optional): Maximum number of requests\
+            in a batch. Defaults to 64
+        batch_delay (float, optional): Seconds to wait for more requests\
+            after the first request of a batch. Defaults to 0.002
+        max_pending (int, optional): Number of requests waiting\
+            for a batch, further requests wait for free space.\
+            Defaults to 1024
+        max_batches (int, optional): Number of batches computed at once.\
+            Defaults to 4
+        timeout (float, optional): Seconds a request may take,\
+            including the time spent waiting for free space.\
+            Defaults to None for no timeout
+    """
+
+    def __init__(self, executor=None, batch_size: int = 64,
+                 batch_delay: float = 0.002, max_pending: int = 1024,
+                 max_batches: int = 4, timeout: float = None) -> None:
+        # pylint: disable=too-many-arguments
+        self._executor = executor
+        self._batch_size = batch_size
+        self._batch_delay = batch_delay
+        self._max_pending = max_pending
+        self._max_batches = max_batches
+        self._timeout = timeout
+        self._queue = None
+        self._slots = None
+        self._collector = None
+        self._batches = set()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Method that waits until accepted requests are computed.\
+            The service may still be used after it is closed
+        """
+        if self._collector is None:
+            return
+        collector, self._collector = self._collector, None
+        await self._queue.put(None)
+        await collector
+        await asyncio.gather(*self._batches)
+
+    async def diff(self, function: str, variable: str = 'x',
+                   **values: dict) -> str:
+        """
+        Method that takes a derivative the same way as derivative.diff
+
+        Args:
+            function (str): Mathematical function to derive
+            variable (str, optional): The variable of differentiation.\
+                Defaults to 'x'
+            **values: Positional arguments for function variables.\
+                If specified calculates derivative at a given point
+
+        Raises:
+            DiffError: Raises when the derivative could not be taken
+            asyncio.TimeoutError: Raises when the request took too long
+
+        Returns:
+            str: Derivative of a function
+        """
+        result = await self.request(function, variable, values)
+        if result.error is not None:
+            raise DiffError(result.error)
+        return result.result
+
+    async def derive(self, function: str, variable: str = 'x',
+                     **values: dict) -> float:
+        """
+        Method that takes derivative of a function at a given point
+
+        Args:
+            function (str): Mathematical function to derive
+            variable (str, optional): The variable of differentiation.\
+                Defaults to 'x'
+            **values: Positional arguments for function variables
+
+        Raises:
+            DiffError: Raises when the derivative could not be taken\
+                or when the point is not specified
+            asyncio.TimeoutError: Raises when the request took too long
+
+        Returns:
+            float: Derivative of a function at a given point
+        """
+        if not values:
+            raise DiffError(describe_error(
+                ValueError("Point was not specified correctly")))
+        return float(await self.diff(function, variable, **values))
+
+    async def request(self, function: str, variable: str = 'x',
+                      values: dict = None) -> DiffResult:
+        """
+        Method that takes a derivative and describes an error\
+            instead of raising it
+
+        Args:
+            function (str): Mathematical function to derive
+            variable (str, optional): The variable of differentiation.\
+                Defaults to 'x'
+            values (dict, optional): Values of function variables.\
+                If specified calculates derivative at a given point.\
+                Defaults to None
+
+        Raises:
+            asyncio.TimeoutError: Raises when the request took too long
+
+        Returns:
+            DiffResult: Either the derivative or the description\
+                of the error that occurred
+        """
+        request = (function, variable, dict(values or {}))
+        return await asyncio.wait_for(self._submit(request), self._timeout)
+
+    async def _submit(self, request: tuple) -> DiffResult:
+        if self._collector is None:
+            self._queue = asyncio.Queue(self._max_pending)
+            self._slots = asyncio.Semaphore(self._max_batches)
+            self._collector = asyncio.create_task(self._collect(self._queue))
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((request, future))
+        return await future
+
+    async def _collect(self, queue: asyncio.Queue) -> None:
+        while (item := await queue.get()) is not None:
+            await self._slots.acquire()
+            if queue.qsize() < self._batch_size - 1:
+                await asyncio.sleep(self._batch_delay)
+            batch = [item]
+            while len(batch) < self._batch_size and not queue.empty():
+                if (item := queue.get_nowait()) is None:
+                    queue.put_nowait(None)
+                    break
+                batch.append(item)
+            task = asyncio.create_task(self._compute(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _compute(self, batch: list) -> None:
+        try:
+            requests = {}
+            for request, future in batch:
+                if not future.done():
+                    requests.setdefault(_request_key(request),
+                                        (request, []))[1].append(future)
+            if not requests:
+                return
+            try:
+                results = await asyncio.get_running_loop().run_in_executor(
+                    self._executor, _diff_batch,
+                    [request for request, _ in requests.values()])
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                results = [DiffResult(request[0], None, describe_error(exc))
+                           for request, _ in requests.values()]
+            for (_, futures), result in zip(requests.values(), results):
+                for future in futures:
+                    if not future.done():
+                        future.set_result(result)
+        finally:
+            self._slots.release()
+
+
+def _request_key(request: tuple) -> tuple:
+    function, variable, values = request
+    return function, variable, tuple(sorted(values.items()))
+
+
+def _diff_batch(requests: list) -> list:
+    # pylint: disable=protected-access
+    return list(map(derivative._diff_request, requests))
+
+
+async def start_server(service: DiffService, host: str = '127.0.0.1',
+                       port: int = 0, path: str = None,
+                       limit: int = 2 ** 20,
+                       max_requests: int = 256) -> asyncio.AbstractServer:
+    """
+    Function that starts a server taking derivatives with a service.\
+        Every line received by the server is a JSON object with\
+        "expression" and optional "variable", "point" and "id" fields.\
+        Every response is a line with a JSON object with the same\
+        "expression" and "id" and either "result" or the error fields\
+        of derivative.describe_error. Responses are sent as soon as\
+        they are ready, so their order may differ from the requests
+
+    Args:
+        service (DiffService): The service
+        host (str, optional): Host of a TCP server.\
+            Defaults to '127.0.0.1'
+        port (int, optional): Port of a TCP server, 0 for any free port.\
+            Defaults to 0
+        path (str, optional): Path of a Unix socket to listen on instead\
+            of TCP. Defaults to None
+        limit (int, optional): Maximum length of a request line in bytes,\
+            longer lines are answered with an error. Defaults to 2 ** 20
+        max_requests (int, optional): Number of requests of a connection\
+            computed at once, the connection is not read while the limit\
+            is reached. Defaults to 256
+
+    Returns:
+        asyncio.AbstractServer: The started server
+    """
+    # pylint: disable=too-many-arguments
+    async def handle(reader, writer):
+        await _handle_connection(service, reader, writer, max_requests)
+
+    if path is not None:
+        return await asyncio.start_unix_server(handle, path, limit=limit)
+    return await asyncio.start_server(handle, host, port, limit=limit)
+
+
+async def _handle_connection(service: DiffService, reader, writer,
+                             max_requests: int) -> None:
+    slots = asyncio.Semaphore(max_requests)
+    lock = asyncio.Lock()
+    tasks = set()
+
+    async def respond(line) -> None:
+        try:
+            if isinstance(line, Exception):
+                response = json.dumps(describe_error(line))
+            else:
+                response = json.dumps(await _respond(service, line))
+            async with lock:
+                writer.write(response.encode('utf-8') + b"\n")
+                await writer.drain()
+        finally:
+            slots.release()
+
+    try:
+        while line := await _read_line(reader):
+            if isinstance(line, bytes) and not line.strip():
+                continue
+            await slots.acquire()
+            task = asyncio.create_task(respond(line))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        await asyncio.gather(*tasks)
+    except ConnectionError:
+        for task in tasks:
+            task.cancel()
+    finally:
+        writer.close()
+
+
+async def _read_line(reader: asyncio.StreamReader):
+    try:
+        return await reader.readuntil(b"\n")
+    except asyncio.IncompleteReadError as exc:
+        return exc.partial
+    except asyncio.LimitOverrunError as exc:
+        error = exc
+    while True:
+        try:
+            await reader.read(error.consumed)
+            await reader.readuntil(b"\n")
+            return error
+        except asyncio.IncompleteReadError:
+            return error
+        except asyncio.LimitOverrunError as exc:
+            error.consumed = exc.consumed
+
+
+async def _respond(service: DiffService, line: bytes) -> dict:
+    try:
+        request = json.loads(line)
+        expression = request['expression']
+        variable = request.get('variable', 'x')
+        point = {name: float(value)
+                 for name, value in request.get('point', {}).items()}
+        if not isinstance(expression, str) or \
+                not isinstance(variable, str):
+            raise TypeError("Expression and variable must be strings")
+    except (ValueError, KeyError, TypeError, AttributeError) as exc:
+        return {'expression': line.decode('utf-8', 'replace').strip()} | \
+            describe_error(exc)
+    response = {'id': request['id']} if 'id' in request else {}
+    response['expression'] = expression
+    try:
+        result = await service.request(expression, variable, point)
+    except asyncio.TimeoutError as exc:
+        return response | describe_error(exc)
+    if result.error is not None:
+        return response | result.error
+    return response | {'result': result.result}
+
+
+def main(argv: list = None) -> int:
+    """
+    Runs a server taking derivatives of functions\
+        received as JSON Lines
+
+    Args:
+        argv (list, optional): Command line arguments.\
+            Defaults to sys.argv
+
+    Returns:
+        int: Exit status
+    """
+    parser = argparse.ArgumentParser(
+        prog='service',
+        description='Server that takes derivatives of functions received\
+            as JSON objects with "expression" and optional "variable",\
+            "point" and "id" fields, one per line')
+    parser.add_argument('--host', default='127.0.0.1',
+                        help='host to listen on (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765,
+                        help='port to listen on (default: 8765)')
+    parser.add_argument('--unix', metavar='PATH',
+                        help='listen on a Unix socket instead of TCP')
+    parser.add_argument('-w', '--workers', type=int, default=1,
+                        help='number of worker processes, threads of\
+                            the event loop are used if not greater\
+                            than 1 (default: 1)')
+    parser.add_argument('--batch-size', type=int, default=64,
+                        help='maximum number of requests in a batch\
+                            (default: 64)')
+    parser.add_argument('--batch-delay', type=float, default=0.002,
+                        help='seconds to wait for more requests of a batch\
+                            (default: 0.002)')
+    parser.add_argument('--max-pending', type=int, default=1024,
+                        help='number of requests waiting for a batch\
+                            (default: 1024)')
+    parser.add_argument('--line-limit', type=int, default=2 ** 20,
+                        metavar='BYTES',
+                        help='maximum length of a request line, longer\
+                            lines are answered with an error\
+                            (default: 1048576)')
+    parser.add_argument('--timeout', type=float,
+                        help='seconds a request may take')
+    parser.add_argument('--store', metavar='PATH',
+                        help='store of precomputed derivatives consulted\
+                            before differentiation')
+    args = parser.parse_args(argv)
+    if args.store is not None:
+        # pylint: disable=import-outside-toplevel
+        from functions.store import DerivativeStore
+        derivative.use_store(DerivativeStore(args.store))
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    executor = None
+    if args.workers > 1:
+        # pylint: disable=import-outside-toplevel,protected-access
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(args.workers,
+                                       initializer=derivative._warm_up,
+                                       initargs=(args.store,))
+    service = DiffService(executor, args.batch_size, args.batch_delay,
+                          args.max_pending, timeout=args.timeout)
+    try:
+        server = await start_server(service, args.host, args.port,
+                                    args.unix, args.line_limit)
+        print("Listening on", args.unix or
+              f"{args.host}:{server.sockets[0].getsockname()[1]}",
+              file=sys.stderr)
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.close()
+        if executor is not None:
+            executor.shutdown()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
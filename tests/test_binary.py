@@ -0,0 +1,74 @@
+"""Test module for functions.binary"""
+import mmap
+import pytest
+from functions import function, binary, flat
+
+
+@pytest.mark.parametrize("func",
+                         ["x^2+2x+2", "(a+b)/c", "sin(x-1/y)",
+                          "e^(lnx/lnpi)", "tg(-cos(e^exp(2/2)))",
+                          "(x+1)*(x+1)-2^(-x)", "0/0", ""])
+def test_round_trip(func):
+    """Test for serializing functions to bytes and back"""
+    data = binary.dumps(function.Function(func))
+    assert binary.load_function(data) is function.Function(func)
+    assert binary.dumps(binary.loads(data)) == data
+
+
+def test_zero_copy(tmp_path):
+    """Test for loading functions from memory maps without copying"""
+    func = function.Function("sin(x*y)/(1+x^2)").diff('x')
+    path = tmp_path / "function.bin"
+    path.write_bytes(binary.dumps(func))
+    with open(path, 'rb') as stream, \
+            mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        loaded = binary.loads(data)
+        assert isinstance(loaded.opcodes, memoryview)
+        assert loaded.evaluate(x=0.5, y=2) == func.evaluate(x=0.5, y=2)
+        assert str(loaded.diff('y')) == \
+            str(flat.FlatFunction(func).diff('y'))
+        del loaded
+
+
+@pytest.mark.parametrize("data",
+                         [b"", b"DRF0" + bytes(12),
+                          binary.dumps(function.Function("x+1"))[:-3],
+                          binary.dumps(function.Function("x+1"))[:-1]])
+def test_invalid_data(data):
+    """Test for errors while loading invalid data"""
+    with pytest.raises(ValueError):
+        _ = binary.load_function(data)
+
+
+@pytest.mark.parametrize("func, index, field, value",
+                         [("x+1", 2, 'opcodes', 100),
+                          ("x+1", 2, 'opcodes', -3),
+                          ("x+1", 2, 'left', -1),
+                          ("x+1", 2, 'left', 2),
+                          ("x+1", 2, 'right', 5),
+                          ("x+1", 1, 'left', 1),
+                          ("x+1", 0, 'left', 3),
+                          ("x+1", 0, 'right', 1),
+                          ("sin(x)", 1, 'right', 0)])
+def test_invalid_nodes(func, index, field, value):
+    """Test for errors while loading functions with invalid nodes"""
+    corrupted = flat.FlatFunction(function.Function(func))
+    getattr(corrupted, field)[index] = value
+    with pytest.raises(ValueError):
+        _ = binary.load_function(binary.dumps(corrupted))
+
+
+@pytest.mark.parametrize("name", ['sin', 'unary-', 'x y', ''])
+def test_invalid_names(name):
+    """Test for errors while loading functions with invalid names"""
+    corrupted = flat.FlatFunction(function.Function("x+1"))
+    corrupted.names[0] = name
+    with pytest.raises(ValueError):
+        _ = binary.load_function(binary.dumps(corrupted))
+
+
+def test_generated_names():
+    """Test for loading functions with names that are not parsed"""
+    func = function.Function.node('+', function.Function.node('t1'),
+                                  function.Function("pi"))
+    assert binary.load_function(binary.dumps(func)) is func
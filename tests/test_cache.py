@@ -0,0 +1,63 @@
+"""Test module for functions.cache"""
+from concurrent.futures import ThreadPoolExecutor
+import derivative
+from functions import cache, function
+
+
+def test_lru_eviction():
+    """Test for eviction of the least recently used entries"""
+    lru = cache.LRUCache(2)
+    lru.put('a', 1)
+    lru.put('b', 2)
+    assert lru.get('a') == 1
+    lru.put('c', 3)
+    assert lru.get('b') is None
+    assert lru.get('a') == 1 and lru.get('c') == 3
+    assert lru.info() == {'hits': 3, 'misses': 1, 'size': 2, 'maxsize': 2}
+
+
+def test_lru_resize_and_clear():
+    """Test for resizing and clearing of caches"""
+    lru = cache.LRUCache(3)
+    for key in range(3):
+        lru.put(key, key)
+    lru.maxsize = 1
+    assert len(lru) == 1 and lru.get(2) == 2
+    lru.clear()
+    assert lru.info() == {'hits': 0, 'misses': 0, 'size': 0, 'maxsize': 1}
+
+
+def test_lru_threads():
+    """Test for concurrent access to caches"""
+    lru = cache.LRUCache(50)
+
+    def work(offset):
+        for key in range(1000):
+            lru.put(key + offset, key)
+            lru.get(key)
+
+    with ThreadPoolExecutor(4) as executor:
+        list(executor.map(work, range(4)))
+    info = lru.info()
+    assert info['size'] == 50 and info['hits'] + info['misses'] == 4000
+
+
+def test_diff_cache():
+    """Test for caching of derivatives of subexpressions"""
+    cache.DIFF_CACHE.clear()
+    simplifier = function.Simplifier.SYMPY
+    function.Function("sin(x)*x").diff('x', simplifier=simplifier)
+    misses = cache.DIFF_CACHE.info()['misses']
+    function.Function("sin(x)*x+x").diff('x', simplifier=simplifier)
+    info = cache.DIFF_CACHE.info()
+    assert info['hits'] == 1 and info['misses'] == misses + 1
+
+
+def test_entry_point_cache():
+    """Test for caching at the derivative.diff entry point"""
+    cache.DIFF_CACHE.clear()
+    cache.TREE_CACHE.clear()
+    assert derivative.diff("x^3") == derivative.diff("x^3") == "3.0*x^2.0"
+    assert cache.DIFF_CACHE.get(("x^3", 'x')) == "3.0*x^2.0"
+    assert cache.TREE_CACHE.get(("x^3", function.Function._token_node)) \
+        is function.Function("x^3")
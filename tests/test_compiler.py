@@ -0,0 +1,60 @@
+"""Test module for functions.compiler"""
+import math
+import pytest
+from functions import function, compiler
+
+
+@pytest.mark.parametrize("func, point",
+                         [("x^2+2x+2", {'x': 3}),
+                          ("sin(x-1/y)", {'x': 2, 'y': 4}),
+                          ("e^(lnx/lnpi)", {'x': 5}),
+                          ("tg(-cos(e^exp(2/2)))", {}),
+                          ("-2^x", {'x': 2}),
+                          ("sqrt(x^2)/(x+1)", {'x': -3})])
+def test_compile(func, point):
+    """Test for compiled functions matching calculate"""
+    compiled = compiler.compile_function(function.Function(func))
+    expected = function.Function(func).calculate(**point).value
+    assert compiled(*(point[name] for name in sorted(point))) == expected
+
+
+@pytest.mark.parametrize("func, variables, args, expected",
+                         [("x-y", ['y', 'x'], (1, 3), 2),
+                          ("x", ['x', 'y'], (1, 3), 1),
+                          ("e*x", ['x'], (3,), 3 * math.e)])
+def test_compile_variables(func, variables, args, expected):
+    """Test for order of arguments of compiled functions"""
+    assert function.Function(func).compile(variables)(*args) == expected
+
+
+@pytest.mark.parametrize("func, args, expected_error",
+                         [("x^y", (0, 0), ZeroDivisionError),
+                          ("x/y", (1, 0), ZeroDivisionError),
+                          ("x^(1/2)", (-1,), ValueError),
+                          ("sqrt(x-5)", (4,), ValueError),
+                          ("ln(sin(x))", (0,), ValueError)])
+def test_compile_errors(func, args, expected_error):
+    """Test for domain errors in compiled functions"""
+    with pytest.raises(expected_error):
+        _ = function.Function(func).compile()(*args)
+
+
+def test_compile_unchecked():
+    """Test for compiled functions without domain checks"""
+    assert isinstance(function.Function("x^(1/2)").compile(
+        check_domain=False)(-1), complex)
+
+
+@pytest.mark.parametrize("func, variables",
+                         [("", None),
+                          ("x+y", ['x']),
+                          ("x", ['x', "y=print('injected')"]),
+                          ("x", ['x', 'x']),
+                          ("x", ['x', 'lambda']),
+                          ("x", ['x', 'sin']),
+                          ("x", ['x', '_t0']),
+                          ("x*e", ['x', 'e'])])
+def test_compile_invalid(func, variables):
+    """Test for functions that can not be compiled"""
+    with pytest.raises(ValueError):
+        _ = function.Function(func).compile(variables)
@@ -0,0 +1,38 @@
+"""Test module for functions.cse"""
+import pytest
+from functions import function, cse
+
+
+@pytest.mark.parametrize("func, expected_str",
+                         [("(x+1)*(x+1)", "t1 = x+1.0; t1*t1"),
+                          ("sin(x^2)+cos(x^2)*x^2",
+                           "t1 = x^2.0; sin(t1)+cos(t1)*t1"),
+                          ("exp(x+y)/(x+y)^2+(x+y)^2",
+                           "t1 = x+y; t2 = t1^2.0; exp(t1)/t2+t2"),
+                          ("x*y+z", "x*y+z"),
+                          ("0/0", "undefined")])
+def test_cse_str(func, expected_str):
+    """Test for writing functions with common subexpressions"""
+    assert cse.cse_str(function.Function(func)) == expected_str
+
+
+def test_cse_names():
+    """Test for names of temporaries not clashing with variables"""
+    node = function.Function.node
+    shared = node('+', node('t1'), node(1.0))
+    temporaries, expression = node('*', shared, shared).cse()
+    assert [name for name, _ in temporaries] == ['_t1']
+    assert expression is node('*', node('_t1'), node('_t1'))
+
+
+def test_cse_evaluation():
+    """Test for evaluating temporaries in order"""
+    func = function.Function("sin(x)/(1+x^2)").diff(
+        'x', True, function.Simplifier.NONE)
+    temporaries, expression = func.cse()
+    point = {'x': 0.7}
+    for name, temporary in temporaries:
+        point[name] = temporary.calculate(**point).value
+    assert len(temporaries) > 1
+    assert expression.calculate(**point).value == \
+        pytest.approx(func.calculate(x=0.7).value)
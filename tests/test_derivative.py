@@ -0,0 +1,101 @@
+"""Test module for derivative"""
+import io
+import json
+import os
+import subprocess
+import sys
+import pytest
+import derivative
+
+
+@pytest.mark.parametrize("func, variable, point, expected",
+                         [("x^2", 'x', {}, "2.0*x"),
+                          ("x^2*y", 'y', {'x': 3, 'y': 1}, "9.0")])
+def test_diff(func, variable, point, expected):
+    """Test for taking derivatives through the module entry point"""
+    assert derivative.diff(func, variable, **point) == expected
+
+
+@pytest.mark.parametrize("args, stdin, expected_output, expected_status",
+                         [([], "x^2\n\nsinx\n", "2.0*x\ncos(x)\n", 0),
+                          (['-v', 'y'], "xy\n", "x\n", 0),
+                          (['-p', 'x=3'], "x^2\n", "6.0\n", 0),
+                          (['-e', 'x^3', '-e', '2x'], "", "3.0*x^2.0\n2.0\n",
+                           0),
+                          ([], "(x+1\nx\n",
+                           "error: ParenthesisMismatchError: "
+                           "position=0, length=1\n1.0\n", 1),
+                          (['-p', 'x=0'], "lnx\n",
+                           "error: ValueError: message=Derivative at that "
+                           "point does not exist\n", 1)])
+def test_main(monkeypatch, capsys, args, stdin,
+              expected_output, expected_status):
+    """Test for the command line interface"""
+    monkeypatch.setattr('sys.stdin', io.StringIO(stdin))
+    assert derivative.main(args) == expected_status
+    assert capsys.readouterr().out == expected_output
+
+
+def test_main_jsonl(tmp_path, capsys):
+    """Test for reading JSON lines and writing JSON results"""
+    path = tmp_path / "functions.jsonl"
+    path.write_text('{"expression": "x^2*y", "variable": "y"}\n'
+                    '{"expression": "x^2", "point": {"x": 2}}\n'
+                    '{"expression": "2sin"}\n'
+                    'x\n', encoding='utf-8')
+    assert derivative.main([str(path), '--jsonl', '-f', 'json']) == 1
+    records = [json.loads(line)
+               for line in capsys.readouterr().out.splitlines()]
+    assert records[0] == {'expression': "x^2*y", 'result': "x^2.0"}
+    assert records[1] == {'expression': "x^2", 'result': "4.0"}
+    assert records[2] == {'expression': "2sin", 'position': 1, 'length': 3,
+                          'error': "EntitiesPlacementError"}
+    assert records[3]['error'] == "JSONDecodeError"
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_diff_many(workers):
+    """Test for taking derivatives of many functions"""
+    results = derivative.diff_many(["x^2", "(x", "sinx", "x/0"],
+                                   workers=workers, chunksize=1)
+    assert [result.expression for result in results] == \
+        ["x^2", "(x", "sinx", "x/0"]
+    assert [result.result for result in results] == \
+        ["2.0*x", None, "cos(x)", "undefined"]
+    assert results[1].error == {'error': "ParenthesisMismatchError",
+                                'position': 0, 'length': 1}
+
+
+def test_diff_many_point():
+    """Test for taking derivatives of many functions at a point"""
+    results = derivative.diff_many(["x^2", "lnx"], workers=2, x=0)
+    assert results[0] == ("x^2", "0.0", None)
+    assert results[1].error == {
+        'error': "ValueError",
+        'message': "Derivative at that point does not exist"}
+
+
+def test_main_workers(monkeypatch, capsys):
+    """Test for the command line interface with worker processes"""
+    monkeypatch.setattr('sys.stdin', io.StringIO("x^2\n2sin\nx\n"))
+    assert derivative.main(['-w', '2', '--chunksize', '1']) == 1
+    assert capsys.readouterr().out == \
+        "2.0*x\nerror: EntitiesPlacementError: position=1, length=3\n1.0\n"
+
+
+def test_lazy_imports():
+    """Test for not importing SymPy and NumPy at import time"""
+    code = "import sys, derivative; " \
+        "print(sorted({'sympy', 'numpy'} & sys.modules.keys()))"
+    process = subprocess.run([sys.executable, '-c', code], check=True,
+                             capture_output=True, text=True,
+                             cwd=os.path.dirname(os.path.dirname(__file__)))
+    assert process.stdout.strip() == "[]"
+
+
+def test_main_profile(capsys):
+    """Test for printing time spent in stages to standard error"""
+    assert derivative.main(['-e', 'x^2*sinx', '--profile']) == 0
+    captured = capsys.readouterr()
+    assert captured.out == "x*(x*cos(x)+2.0*sin(x))\n"
+    assert any(line.startswith('diff') for line in captured.err.splitlines())
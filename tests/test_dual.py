@@ -0,0 +1,66 @@
+"""Test module for functions.dual"""
+import pytest
+from functions import function, dual
+
+
+@pytest.mark.parametrize("func, variable, point",
+                         [("x^2-2z", 'x', {'x': 5, 'z': 2}),
+                          ("cosx+yx", 'x', {'x': 0, 'y': 2}),
+                          ("e^sinx", 'x', {'x': 0}),
+                          ("lnx", 'x', {'x': 5}),
+                          ("x^x", 'x', {'x': 1.5}),
+                          ("2^(x/y)", 'y', {'x': 1, 'y': 3}),
+                          ("sqrt(x^3)-tg(x)/x", 'x', {'x': 0.5}),
+                          ("-exp(cos(x))", 'x', {'x': 2}),
+                          ("x^2", 'x', {'x': 0}),
+                          ("2x+y^3-sin(tg(z))", 'w',
+                           {'x': 10, 'y': 20, 'z': 30})])
+def test_derive_forward(func, variable, point):
+    """Test for derivatives with dual numbers matching derive"""
+    expected = function.Function(func).derive(variable, **point)
+    assert dual.derive_forward(function.Function(func), variable,
+                               **point) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("func, variable, point, expected_message",
+                         [("ln(x+y-z^2)", 'x', {'x': 0, 'y': 0},
+                           "Point was not specified correctly"),
+                          ("tg(x/2)", 'x', {},
+                           "Point was not specified correctly"),
+                          ("", 'x', {'x': -2},
+                           "Derivative at that point does not exist"),
+                          ("sqrt(x^2)", 'x', {'x': 0},
+                           "Derivative at that point does not exist"),
+                          ("x^0.5", 'x', {'x': 0},
+                           "Derivative at that point does not exist"),
+                          ("ln(sin(x))", 'x', {'x': 0},
+                           "Derivative at that point does not exist"),
+                          ("e^cosx*1/tgx", 'x', {'x': 0},
+                           "Derivative at that point does not exist")])
+def test_derive_forward_errors(func, variable, point, expected_message):
+    """Test for errors while taking derivatives with dual numbers"""
+    with pytest.raises(ValueError) as excinfo:
+        _ = function.Function(func).derive_forward(variable, **point)
+    assert str(excinfo.value) == expected_message
+
+
+@pytest.mark.parametrize("func, point",
+                         [("sqrt(0)", {'x': 0}),
+                          ("x+sqrt(1-1)", {'x': 2}),
+                          ("x^sqrt(0)", {'x': 1}),
+                          ("(0-1)^2+x", {'x': 1}),
+                          ("x+sqrt(y)", {'x': 1, 'y': 0}),
+                          ("sqrt(x)", {'x': 0}),
+                          ("ln(x)", {'x': 0}),
+                          ("x+ln(1)", {'x': 0}),
+                          ("sqrt(4)*x", {'x': 0})])
+def test_domain_boundaries(func, point):
+    """Test for derivatives with dual numbers at domain boundaries"""
+    func = function.Function(func)
+    try:
+        expected = func.derive('x', **point)
+    except ValueError:
+        with pytest.raises(ValueError):
+            _ = func.derive_forward('x', **point)
+    else:
+        assert func.derive_forward('x', **point) == pytest.approx(expected)
@@ -73,6 +73,18 @@ def test_skipped_muls(expression, expected_rpn):
     assert "".join(expr_parser.Parser(expression).rpn) == expected_rpn
 
 
+@pytest.mark.parametrize("expression, expected_rpn",
+                         [("xsinx", "xxsin*"),
+                          ("ee^x", "eex^*"),
+                          ("expe", "eexp"),
+                          ("texpx", "txexp*"),
+                          ("pitaux", "pitau*x*"),
+                          ("ax2,5y", "ax*2.5*y*")])
+def test_tokenize_words(expression, expected_rpn):
+    """Test for splitting words into operators, constants and variables"""
+    assert "".join(expr_parser.Parser(expression).rpn) == expected_rpn
+
+
 @pytest.mark.parametrize("expression, expected_rpn",
                          [("(x+y)z", "xy+z*"),
                           ("(x-y+z)sinx", "xy-z+xsin*"),
@@ -113,3 +125,62 @@ def test_errors(expression, expected_error, expected_error_message):
     with pytest.raises(expected_error) as excinfo:
         _ = expr_parser.Parser(expression).rpn
     assert str(excinfo.value) == expected_error_message
+
+
+@pytest.mark.parametrize("expression, expected_tree",
+                         [("", None),
+                          ("x", ('x',)),
+                          ("-x+y", ('+', ('unary-', ('x',)), ('y',))),
+                          ("2sin(x^2)", ('*', ('2',),
+                                         ('sin', ('^', ('x',), ('2',)))))])
+def test_build_tree(expression, expected_tree):
+    """Test for building trees of expressions"""
+    assert expr_parser.Parser(expression).build_tree(
+        lambda token, *operands: (token, *operands)) == expected_tree
+
+
+def test_build_deep_tree():
+    """Test for building trees of deeply nested expressions"""
+    tree = expr_parser.Parser("sin(" * 5000 + "x" + ")" * 5000).build_tree(
+        lambda token, *operands: (token, *operands))
+    assert tree[0] == 'sin'
+
+
+@pytest.mark.parametrize("expression, expected_error, expected_error_message",
+                         [("(x + 1) + 0))",
+                           expr_parser.ParenthesisMismatchError,
+                           "\n(x+1)+0))\n       ^"),
+                          ("1+x++3", expr_parser.EntitiesPlacementError,
+                           "\n1+x++3\n    ^"),
+                          ("2sinx+", expr_parser.EntitiesPlacementError,
+                           "\n2sinx+\n     ^")])
+def test_build_tree_errors(expression, expected_error,
+                           expected_error_message):
+    """Test for errors while building trees of expressions"""
+    with pytest.raises(expected_error) as excinfo:
+        _ = expr_parser.Parser(expression).build_tree(
+            lambda token, *operands: (token, *operands))
+    assert str(excinfo.value) == expected_error_message
+
+
+def test_shared_rpn():
+    """Test for sharing tokens between parsers of equal expressions"""
+    expr_parser.Parser.cache_clear()
+    rpn = expr_parser.Parser("2 sin(x)").rpn
+    assert isinstance(rpn, tuple)
+    assert expr_parser.Parser("2sin( x )").rpn is rpn
+    assert expr_parser.Parser.cache_info()['rpn'] == \
+        {'hits': 1, 'misses': 1, 'size': 1, 'maxsize': 4096}
+
+
+def test_shared_tree():
+    """Test for sharing trees between parsers of equal expressions"""
+    def make_node(token, *operands):
+        return (token, *operands)
+
+    expr_parser.Parser.cache_clear()
+    tree = expr_parser.Parser("x + 1").build_tree(make_node)
+    assert expr_parser.Parser("x+1").build_tree(make_node) is tree
+    assert expr_parser.Parser.cache_info()['tree']['hits'] == 1
+    expr_parser.Parser.cache_clear()
+    assert expr_parser.Parser.cache_info()['tree']['size'] == 0
@@ -0,0 +1,59 @@
+"""Test module for functions.flat"""
+import pytest
+from functions import function, flat
+
+
+@pytest.mark.parametrize("func",
+                         ["x^2+2x+2", "(a+b)/c", "sin(x-1/y)",
+                          "e^(lnx/lnpi)", "tg(-cos(e^exp(2/2)))",
+                          "(x+1)*(x+1)-2^(-x)", "0/0", ""])
+def test_round_trip(func):
+    """Test for converting functions to flat functions and back"""
+    flat_function = flat.FlatFunction.from_function(function.Function(func))
+    assert flat_function.to_function() is function.Function(func)
+    assert str(flat_function) == str(function.Function(func))
+
+
+def test_shared_nodes():
+    """Test for storing equal subexpressions once"""
+    flat_function = flat.FlatFunction(function.Function("(x+1)*(x+1)"))
+    assert len(flat_function) == 4
+    assert list(flat_function.opcodes) == \
+        [flat.NAME, flat.NUMBER, flat.OPCODES['+'], flat.OPCODES['*']]
+    assert list(flat_function.constants) == [1.0]
+    assert flat_function.names == ['x']
+
+
+@pytest.mark.parametrize("func, variable",
+                         [("x^2+2x+2", 'x'),
+                          ("sin(x*y)/(1+x^2)", 'y'),
+                          ("sqrt(x)*exp(x)-ln(tg(x))", 'x'),
+                          ("-cos(x)^x", 'x'),
+                          ("5", 'x')])
+def test_diff(func, variable):
+    """Test for differentiating flat functions"""
+    derivative = flat.FlatFunction(function.Function(func)).diff(variable)
+    assert derivative.to_function() is function.Function(func).diff(
+        variable, True, function.Simplifier.NONE)
+
+
+@pytest.mark.parametrize("func, point",
+                         [("x^2+2x+2", {'x': 3}),
+                          ("sin(x-1/y)", {'x': 2, 'y': 4}),
+                          ("e^(lnx/lnpi)", {'x': 5}),
+                          ("tg(-cos(e^exp(2/2)))", {})])
+def test_evaluate(func, point):
+    """Test for evaluating flat functions"""
+    assert flat.FlatFunction(function.Function(func)).evaluate(**point) == \
+        function.Function(func).evaluate(**point)
+
+
+@pytest.mark.parametrize("func, point, expected_error",
+                         [("x/y", {'x': 1, 'y': 0}, ZeroDivisionError),
+                          ("ln(x)", {'x': -1}, ValueError),
+                          ("x+y", {'x': 1}, ValueError),
+                          ("", {}, ValueError)])
+def test_evaluate_errors(func, point, expected_error):
+    """Test for errors while evaluating flat functions"""
+    with pytest.raises(expected_error):
+        _ = flat.FlatFunction(function.Function(func)).evaluate(**point)
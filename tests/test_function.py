@@ -1,4 +1,6 @@
 """Test module for functions.function"""
+import io
+import pickle
 import pytest
 from functions import function
 
@@ -50,6 +52,22 @@ def test_calculate(func, expected_str, point):
     assert str(function.Function(func).calculate(**point)) == expected_str
 
 
+@pytest.mark.parametrize("func, expected_str",
+                         [("y/0.5+-3", "y/0.5+(-3.0)"),
+                          ("x*-2", "x*(-2.0)"),
+                          ("x--3", "x-(-3.0)"),
+                          ("x^(0-2)", "x^(-2.0)"),
+                          ("(0-2)^x", "(-2.0)^x"),
+                          ("-2+x", "-2.0+x")])
+def test_negative_numbers(func, expected_str):
+    """Test for writing negative numbers that are operands"""
+    calculated = function.Function(func).calculate()
+    assert str(calculated) == expected_str
+    point = {'x': 2.0, 'y': 1.0}
+    assert function.Function(expected_str).evaluate(**point) == \
+        calculated.evaluate(**point)
+
+
 @pytest.mark.parametrize("func, variable, point, expected_str",
                          [("x^2-2z", 'x', {'x': 5, 'z': 2}, "10.0"),
                           ("cosx+yx", 'x', {'x': 0, 'y': 2}, "2.0"),
@@ -98,3 +116,203 @@ def test_derive_errors(func, variable, point, expected_error):
     """Test for errors in functions that may occur while taking derivative"""
     with pytest.raises(expected_error):
         _ = function.Function(func).derive(variable, **point)
+
+
+@pytest.mark.parametrize("func, variable, expected_str",
+                         [("-sin(x^3)", 'x', "-(3.0)*x^2.0*cos(x^3.0)"),
+                          ("(x-1)/(x+1)", 'x', "2.0/(x+1.0)^2.0"),
+                          ("sqrt(x^2)", 'x', "x/sqrt(x^2.0)"),
+                          ("exp(cos(x))", 'x', "-(exp(cos(x)))*sin(x)"),
+                          ("", 'x', "undefined")])
+def test_diff_deferred(func, variable, expected_str):
+    """Test for differentiating functions with a single simplification"""
+    assert str(function.Function(func).diff(
+        variable, deferred=True)) == expected_str
+
+
+@pytest.mark.parametrize("func, variable, deferred, expected_str",
+                         [("xyz", 'x', False, "y*z"),
+                          ("xyz", 'x', True, "y*z"),
+                          ("exp(cos(x))", 'x', True, "-(sin(x)*exp(cos(x)))"),
+                          ("2x+3", 'x', True, "2.0"),
+                          ("(x-1)/(x+1)", 'x', True, "2.0/(x+1.0)^2.0"),
+                          ("0/0+x", 'x', True, "undefined")])
+def test_diff_native(func, variable, deferred, expected_str):
+    """Test for differentiating functions with the native simplifier"""
+    assert str(function.Function(func).diff(
+        variable, deferred=deferred,
+        simplifier=function.Simplifier.NATIVE)) == expected_str
+
+
+@pytest.mark.parametrize("func, expected_str",
+                         [("x*1+0", "x"),
+                          ("0*sinx", "0.0"),
+                          ("x^1-0", "x"),
+                          ("--x", "x"),
+                          ("2*3-x", "6.0-x"),
+                          ("x*(0-3)", "-3.0*x"),
+                          ("1/0+x", "undefined")])
+def test_simplify_native(func, expected_str):
+    """Test for simplifying functions without SymPy"""
+    assert str(function.Function(func).simplify(
+        function.Simplifier.NATIVE)) == expected_str
+
+
+@pytest.mark.parametrize("func, expected_variables",
+                         [("", set()),
+                          ("x^2+2x", {'x'}),
+                          ("e^(ab)+pi", {'a', 'b'})])
+def test_variables(func, expected_variables):
+    """Test for variables of functions"""
+    assert function.Function(func).variables == expected_variables
+
+
+@pytest.mark.parametrize("func, other",
+                         [("x^2+2x", "x ^ 2 + 2 * x"),
+                          ("sin(x)", "sinx"),
+                          ("", "undefined")])
+def test_interning(func, other):
+    """Test for interning of structurally equal functions"""
+    assert function.Function(func) is function.Function(other)
+
+
+def test_shared_subexpressions():
+    """Test for storing equal subexpressions once"""
+    func = function.Function("(x+1)*(x+1)")
+    assert func.left is func.right
+    derivative = func.diff('x', simplifier=function.Simplifier.NONE)
+    assert derivative.left.right is derivative.right.left is func.left
+
+
+def test_immutable():
+    """Test for immutability of function nodes"""
+    func = function.Function("x+1")
+    with pytest.raises(AttributeError):
+        func.value = '-'
+    assert str(func) == "x+1.0"
+
+
+@pytest.mark.parametrize("func",
+                         ["e^sinx/y", "(x+1)*(x+1)-sin(x+1)", "undefined",
+                          "sin(" * 20000 + "x" + ")" * 20000])
+def test_pickle(func):
+    """Test for pickling of interned functions"""
+    func = function.Function(func)
+    assert pickle.loads(pickle.dumps(func)) is func
+
+
+def test_signed_zero():
+    """Test for interning of numbers that are equal but differ in sign"""
+    zero = function.Function.node(0.0)
+    negative_zero = function.Function.node(-0.0)
+    assert negative_zero is not zero
+    assert str(negative_zero) == "-0.0"
+    assert function.Function.node(-0.0) is negative_zero
+    product = function.Function.node('*', function.Function.node(2.0),
+                                     negative_zero)
+    assert str(product.evaluate()) == "-0.0"
+
+
+def test_deep_function():
+    """Test for functions nested deeper than the recursion limit"""
+    depth = 10000
+    func = function.Function("sin(" * depth + "x" + ")" * depth)
+    assert str(func) == "sin(" * depth + "x" + ")" * depth
+    assert func.calculate(x=0).value == 0.0
+    derivative = func.diff('x', deferred=True,
+                           simplifier=function.Simplifier.NATIVE)
+    assert derivative.calculate(x=0).value == 1.0
+    assert func.diff('x', simplifier=function.Simplifier.NATIVE) is derivative
+
+
+def test_long_function():
+    """Test for functions with a large number of terms"""
+    terms = 10000
+    func = function.Function("+".join(["x^2"] * terms))
+    assert func.calculate(x=1).value == terms
+    assert str(func.diff('x', deferred=True,
+                         simplifier=function.Simplifier.NATIVE)) == \
+        f"{2.0 * terms}*x"
+
+
+@pytest.mark.parametrize("func, order, expected_str",
+                         [("x^3", 0, "x^3.0"),
+                          ("x^3", 2, "6.0*x"),
+                          ("x^3", 4, "0.0"),
+                          ("sin(x)", 3, "-(cos(x))"),
+                          ("exp(2x)", 2, "4.0*exp(2.0*x)")])
+def test_diff_order(func, order, expected_str):
+    """Test for differentiating functions several times"""
+    assert str(function.Function(func).diff('x', order=order)) == \
+        expected_str
+
+
+def test_diff_negative_order():
+    """Test for differentiating functions a negative number of times"""
+    with pytest.raises(ValueError):
+        _ = function.Function("x").diff('x', order=-1)
+
+
+@pytest.mark.parametrize("func, point, expected",
+                         [("2x + x", {'x': 2}, 6.0),
+                          ("e^x", {'x': 0}, 1.0),
+                          ("x^2-siny+exp(z)", {'x': 2, 'y': 0, 'z': 0}, 5.0),
+                          ("tg(-cos(e^exp(2/2)))", {},
+                           function.Function("tg(-cos(e^exp(2/2)))")
+                           .calculate().value)])
+def test_evaluate(func, point, expected):
+    """Test for evaluating functions to numbers"""
+    assert function.Function(func).evaluate(**point) == expected
+
+
+@pytest.mark.parametrize("func, point, expected_error",
+                         [("x^y", {'x': 0, 'y': 0}, ZeroDivisionError),
+                          ("x/y", {'x': 1, 'y': 0}, ZeroDivisionError),
+                          ("x^(1/2)", {'x': -1}, ValueError),
+                          ("ln(sin(x))", {'x': 0}, ValueError),
+                          ("x+y", {'x': 1}, ValueError),
+                          ("", {}, ValueError)])
+def test_evaluate_errors(func, point, expected_error):
+    """Test for errors in functions that may occur during evaluation"""
+    with pytest.raises(expected_error):
+        _ = function.Function(func).evaluate(**point)
+
+
+def test_evaluate_undefined_node():
+    """Test for evaluating functions with undefined subexpressions"""
+    func = function.Function("y/(y-1)-sqrt(0/x)")
+    with pytest.raises(ValueError):
+        _ = func.diff('x').evaluate(x=1, y=0)
+    with pytest.raises(ValueError):
+        _ = func.derive('x', x=1, y=0)
+
+
+@pytest.mark.parametrize("func, point, expected",
+                         [("x/y", {'x': 1, 'y': 0}, False),
+                          ("x/y", {'x': 1}, True),
+                          ("ln(x)+y", {'x': 0}, False),
+                          ("ln(x)+y", {'x': 1, 'y': 2}, True)])
+def test_validate_function(func, point, expected):
+    """Test for validating functions at complete and partial points"""
+    assert function.Function(func).validate_function(**point) == expected
+
+
+@pytest.mark.parametrize("func",
+                         ["x^2+2x+2", "tg(-cos(e^exp(2/2)))", "0/0", "",
+                          "(a+b)/c-2^(-x)"])
+def test_write(func, chunksize=2):
+    """Test for writing functions to streams"""
+    stream = io.StringIO()
+    function.Function(func).write(stream, chunksize)
+    assert stream.getvalue() == str(function.Function(func))
+
+
+@pytest.mark.parametrize("func, expected",
+                         [("x/(1-1)", False),
+                          ("x/(1-2)", True),
+                          ("sin(x)+ln(cos(pi))", False),
+                          ("ln(x)^(1/0*x)", False),
+                          ("sqrt(x-2)", True)])
+def test_node_validity(func, expected):
+    """Test for validity of functions tracked on nodes"""
+    assert function.Function(func).validate_function() == expected
@@ -0,0 +1,58 @@
+"""Test module for functions.gradient"""
+import pytest
+from functions import function, gradient
+
+
+@pytest.mark.parametrize("func, point",
+                         [("x^2*y+sin(x*y)", {'x': 1.5, 'y': -2}),
+                          ("ln(x/y)+sqrt(x)", {'x': 3, 'y': 0.5}),
+                          ("x^y-2^(x/y)", {'x': 1.7, 'y': 0.6}),
+                          ("tg(x)*cos(y)-exp(-z)", {'x': 1, 'y': 2, 'z': 3}),
+                          ("x*x*x", {'x': 2}),
+                          ("x^2", {'x': 0, 'y': 1})])
+def test_gradient(func, point):
+    """Test for gradients matching derivatives by every variable"""
+    expected = {variable: function.Function(func).derive_forward(
+        variable, **point) for variable in point}
+    assert gradient.gradient(function.Function(func), **point) == \
+        pytest.approx(expected)
+
+
+@pytest.mark.parametrize("func, point, expected_message",
+                         [("x+y", {'x': 1},
+                           "Point was not specified correctly"),
+                          ("sqrt(x^2)+y", {'x': 0, 'y': 1},
+                           "Derivative at that point does not exist"),
+                          ("x/y", {'x': 1, 'y': 0},
+                           "Derivative at that point does not exist"),
+                          ("", {'x': 1},
+                           "Derivative at that point does not exist")])
+def test_gradient_errors(func, point, expected_message):
+    """Test for errors while taking gradients"""
+    with pytest.raises(ValueError) as excinfo:
+        _ = function.Function(func).gradient(**point)
+    assert str(excinfo.value) == expected_message
+
+
+@pytest.mark.parametrize("func, variables, expected",
+                         [("x^2*y+sin(x*y)", None,
+                           {'x': "cos(x*y)*y+2.0*y*x",
+                            'y': "cos(x*y)*x+x^2.0"}),
+                          ("ln(x/y)", ['y', 'z'],
+                           {'y': "-1.0/y", 'z': "0.0"}),
+                          ("", ['x'], {'x': "undefined"})])
+def test_grad(func, variables, expected):
+    """Test for symbolic gradients"""
+    derivatives = function.Function(func).grad(
+        variables, function.Simplifier.NATIVE)
+    assert {variable: str(derivative)
+            for variable, derivative in derivatives.items()} == expected
+
+
+def test_grad_matches_diff():
+    """Test for symbolic gradients matching derivatives by every variable"""
+    func = function.Function("sin(x*y)/(x+y)")
+    derivatives = func.grad()
+    for variable in ('x', 'y'):
+        assert derivatives[variable].calculate(x=0.3, y=1.2).value == \
+            pytest.approx(func.diff(variable).calculate(x=0.3, y=1.2).value)
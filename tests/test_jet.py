@@ -0,0 +1,52 @@
+"""Test module for functions.jet"""
+import math
+import pytest
+from functions import function, jet
+
+
+@pytest.mark.parametrize("func, point, order, expected",
+                         [("exp(x)", 0, 4, [1, 1, 1 / 2, 1 / 6, 1 / 24]),
+                          ("sin(x)+cos(x)", 0, 3, [1, 1, -1 / 2, -1 / 6]),
+                          ("tg(x)", 0, 5, [0, 1, 0, 1 / 3, 0, 2 / 15]),
+                          ("ln(1+x)", 0, 4, [0, 1, -1 / 2, 1 / 3, -1 / 4]),
+                          ("1/(1-x)", 0, 3, [1, 1, 1, 1]),
+                          ("sqrt(x)", 4, 2, [2, 1 / 4, -1 / 64]),
+                          ("x^3", 0, 4, [0, 0, 0, 1, 0]),
+                          ("2^x", 0, 2,
+                           [1, math.log(2), math.log(2) ** 2 / 2]),
+                          ("x^x", 1, 2, [1, 1, 1]),
+                          ("5", 2, 2, [5, 0, 0]),
+                          ("x^2", 3, 0, [9])])
+def test_taylor(func, point, order, expected):
+    """Test for Taylor coefficients of functions"""
+    assert jet.taylor(function.Function(func), 'x', point, order) == \
+        pytest.approx(expected)
+
+
+def test_taylor_matches_diff():
+    """Test for Taylor coefficients matching symbolic derivatives"""
+    func = function.Function("x^2.5*ln(x+y)/(1+x)")
+    coefficients = func.taylor('x', 1, 4, y=2)
+    for order in range(1, 5):
+        derivative = func.diff('x', True, function.Simplifier.NATIVE, order)
+        assert coefficients[order] == pytest.approx(
+            derivative.calculate(x=1, y=2).value / math.factorial(order))
+
+
+@pytest.mark.parametrize("func, point, order, values, expected_message",
+                         [("x+y", 1, 2, {},
+                           "Point was not specified correctly"),
+                          ("x", 1, -1, {}, "Order must not be negative"),
+                          ("sqrt(x)", 0, 1, {},
+                           "Derivative at that point does not exist"),
+                          ("x^0.5", 0, 2, {},
+                           "Derivative at that point does not exist"),
+                          ("ln(x)", -1, 1, {},
+                           "Derivative at that point does not exist"),
+                          ("", 0, 1, {},
+                           "Derivative at that point does not exist")])
+def test_taylor_errors(func, point, order, values, expected_message):
+    """Test for errors while calculating Taylor coefficients"""
+    with pytest.raises(ValueError) as excinfo:
+        _ = function.Function(func).taylor('x', point, order, **values)
+    assert str(excinfo.value) == expected_message
@@ -0,0 +1,43 @@
+"""Test module for functions.profiling"""
+from functions import function, profiling
+from functions.cache import DIFF_CACHE
+
+
+def test_profile():
+    """Test for collecting statistics of stages"""
+    DIFF_CACHE.clear()
+    with profiling.profile() as statistics:
+        func = function.Function("x^2+sin(y)")
+        _ = func.diff('x', order=2, simplifier=function.Simplifier.NATIVE)
+        _ = func.calculate(x=1)
+        _ = func.evaluate(x=1, y=2)
+        _ = str(func)
+    result = statistics.as_dict()
+    assert result['stages']['diff']['calls'] == 2
+    assert result['stages']['diff']['seconds'] > 0
+    assert result['stages']['calculate']['calls'] == 1
+    assert result['counters']['calculate.nodes'] == 6
+    assert result['counters']['evaluate.nodes'] == 6
+    assert 'str' in statistics.summary()
+
+
+def test_profile_disabled():
+    """Test for not collecting statistics outside of a profile"""
+    with profiling.profile() as statistics:
+        pass
+    _ = function.Function("x^3").calculate(x=2)
+    assert statistics.as_dict() == {'stages': {}, 'counters': {}}
+
+
+def test_profiled():
+    """Test for recording only the outermost of nested calls"""
+    @profiling.profiled('stage')
+    def factorial(number):
+        profiling.count('calls')
+        return 1 if number <= 1 else number * factorial(number - 1)
+
+    with profiling.profile() as statistics:
+        assert factorial(5) == 120
+    result = statistics.as_dict()
+    assert result['stages']['stage']['calls'] == 5
+    assert result['counters'] == {'calls': 5}
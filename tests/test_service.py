@@ -0,0 +1,136 @@
+"""Test module for service"""
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+import service
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    """Executor that records sizes of batches and may delay them"""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        super().__init__(1)
+        self.batches = []
+        self.delay = delay
+
+    def submit(self, fn, /, *args, **kwargs):
+        self.batches.append(len(args[0]))
+
+        def delayed():
+            time.sleep(self.delay)
+            return fn(*args, **kwargs)
+        return super().submit(delayed)
+
+
+def test_diff():
+    """Test for batching and deduplication of concurrent requests"""
+    async def run():
+        async with service.DiffService(executor) as diff_service:
+            return await asyncio.gather(
+                *(diff_service.diff("x^2") for _ in range(10)),
+                diff_service.diff("xy", 'y'),
+                diff_service.derive("x^2*y", 'y', x=3, y=1))
+
+    with RecordingExecutor() as executor:
+        results = asyncio.run(run())
+    assert results == ["2.0*x"] * 10 + ["x", 9.0]
+    assert executor.batches == [3]
+
+
+@pytest.mark.parametrize("func, point, error",
+                         [("(x+1", {}, 'ParenthesisMismatchError'),
+                          ("lnx", {'x': 0}, 'ValueError')])
+def test_diff_error(func, point, error):
+    """Test for errors of taking derivatives"""
+    async def run():
+        async with service.DiffService() as diff_service:
+            await diff_service.diff(func, **point)
+
+    with pytest.raises(service.DiffError) as info:
+        asyncio.run(run())
+    assert info.value.description['error'] == error
+
+
+@pytest.mark.parametrize("func, point", [("x^2", {}), ("x^2", {'y': 1})])
+def test_derive_error(func, point):
+    """Test for errors of taking derivatives at a point"""
+    async def run():
+        async with service.DiffService() as diff_service:
+            await diff_service.derive(func, **point)
+
+    with pytest.raises(service.DiffError) as info:
+        asyncio.run(run())
+    assert info.value.description == {
+        'error': 'ValueError', 'message': "Point was not specified correctly"}
+
+
+def test_timeout():
+    """Test for requests that took too long"""
+    async def run():
+        async with service.DiffService(executor, timeout=0.05) as slow:
+            with pytest.raises(asyncio.TimeoutError):
+                await slow.diff("x^2")
+
+    with RecordingExecutor(0.2) as executor:
+        asyncio.run(run())
+
+
+def test_server():
+    """Test for the JSON Lines server"""
+    lines = [{'id': 1, 'expression': "x^2"},
+             {'id': 2, 'expression': "x^2*y", 'variable': 'y',
+              'point': {'x': 3, 'y': 1}},
+             {'id': 3, 'expression': "(x+1"},
+             {'expression': 5}]
+
+    async def run():
+        async with service.DiffService() as diff_service:
+            server = await service.start_server(diff_service)
+            async with server:
+                port = server.sockets[0].getsockname()[1]
+                reader, writer = await asyncio.open_connection(
+                    '127.0.0.1', port)
+                writer.write("".join(json.dumps(line) + "\n"
+                                     for line in lines).encode() + b"{\n")
+                writer.write_eof()
+                responses = [json.loads(line) async for line in reader]
+                writer.close()
+                return responses
+
+    responses = asyncio.run(run())
+    assert len(responses) == 5
+    assert {'id': 1, 'expression': "x^2", 'result': "2.0*x"} in responses
+    assert {'id': 2, 'expression': "x^2*y", 'result': "9.0"} in responses
+    assert {'id': 3, 'expression': "(x+1", 'error': 'ParenthesisMismatchError',
+            'position': 0, 'length': 1} in responses
+    assert sorted(response['error'] for response in responses
+                  if 'id' not in response) == ['JSONDecodeError', 'TypeError']
+
+
+def test_server_long_line():
+    """Test for request lines longer than the limit of the server"""
+    lines = [json.dumps({'id': 1, 'expression': "x^2"}),
+             json.dumps({'id': 2, 'expression': "+".join(["x"] * 40000)}),
+             json.dumps({'id': 3, 'expression': "x^3"})]
+
+    async def run():
+        async with service.DiffService() as diff_service:
+            server = await service.start_server(diff_service, limit=2 ** 16)
+            async with server:
+                port = server.sockets[0].getsockname()[1]
+                reader, writer = await asyncio.open_connection(
+                    '127.0.0.1', port)
+                writer.write("\n".join(lines).encode() + b"\n")
+                writer.write_eof()
+                responses = [json.loads(line) async for line in reader]
+                writer.close()
+                return responses
+
+    responses = asyncio.run(run())
+    assert len(responses) == 3
+    assert {'id': 1, 'expression': "x^2", 'result': "2.0*x"} in responses
+    assert {'id': 3, 'expression': "x^3", 'result': "3.0*x^2.0"} in responses
+    assert [response['error'] for response in responses
+            if 'id' not in response] == ['LimitOverrunError']
@@ -0,0 +1,55 @@
+"""Test module for functions.simplifier"""
+import pytest
+from functions import function, simplifier
+
+
+@pytest.mark.parametrize("func, expected_str",
+                         [("2*3+1", "7.0"),
+                          ("sqrt(4)-ln(1)", "2.0"),
+                          ("x-(2-3)", "x+1.0"),
+                          ("1/0", "undefined"),
+                          ("ln(0)+x", "undefined")])
+def test_constant_folding(func, expected_str):
+    """Test for folding of constant subexpressions"""
+    assert str(simplifier.simplify_native(
+        function.Function(func))) == expected_str
+
+
+@pytest.mark.parametrize("func, expected_str",
+                         [("x+0", "x"),
+                          ("0-x", "-(x)"),
+                          ("1*x/1", "x"),
+                          ("x^1", "x"),
+                          ("x^0+1^x", "2.0"),
+                          ("0*lnx+0/y", "0.0"),
+                          ("0*(1/0)", "undefined")])
+def test_identities(func, expected_str):
+    """Test for elimination of identities and annihilators"""
+    assert str(simplifier.simplify_native(
+        function.Function(func))) == expected_str
+
+
+@pytest.mark.parametrize("func, expected_str",
+                         [("2x + x", "3.0*x"),
+                          ("x + y + z + x", "2.0*x+y+z"),
+                          ("xy+yx-3", "2.0*x*y-3.0"),
+                          ("sinx-2sinx", "-(sin(x))"),
+                          ("-(x-y)", "y-x"),
+                          ("x-x", "0.0")])
+def test_like_terms(func, expected_str):
+    """Test for collecting like terms"""
+    assert str(simplifier.simplify_native(
+        function.Function(func))) == expected_str
+
+
+@pytest.mark.parametrize("func, expected_str",
+                         [("x^1/2 * x^2", "0.5*x^3.0"),
+                          ("x*x*x", "x^3.0"),
+                          ("2/x*x^3", "2.0*x^2.0"),
+                          ("(x^2)^3*x", "x^7.0"),
+                          ("x/x", "1.0"),
+                          ("y/(x^2*y^3)", "1.0/(y^2.0*x^2.0)")])
+def test_powers(func, expected_str):
+    """Test for combining powers"""
+    assert str(simplifier.simplify_native(
+        function.Function(func))) == expected_str
@@ -0,0 +1,60 @@
+"""Test module for functions.store"""
+import pytest
+import derivative
+from functions import function, store
+from functions.cache import DIFF_CACHE
+
+
+@pytest.fixture(name="path")
+def fixture_path(tmp_path):
+    """Path of a new store"""
+    return str(tmp_path / "derivatives.db")
+
+
+def test_put_get(path):
+    """Test for storing derivatives"""
+    with store.DerivativeStore(path, writable=True, capacity=2) as writer:
+        for power in range(1, 50):
+            func = function.Function(f"x^{power}").diff('x')
+            writer.put(f"x^{power}", 'x', str(func), func)
+        writer.put("x^2", 'x', "replaced")
+        assert len(writer) == 49
+    with store.DerivativeStore(path) as reader:
+        assert reader.get("x ^ 2") == "2.0*x"
+        assert reader.get("x^2", 'y') is None
+        assert reader.get("x^51") is None
+        assert ("x^7", 'x') in reader
+        assert reader.get_function("x^3").evaluate(x=2) == 12.0
+
+
+def test_reader_sees_appends(path):
+    """Test for reading derivatives appended after opening a store"""
+    with store.DerivativeStore(path, writable=True, capacity=4) as writer, \
+            store.DerivativeStore(path) as reader:
+        for power in range(10):
+            writer.put(f"x^{power}", 'x', f"derivative {power}")
+            assert reader.get(f"x^{power}") == f"derivative {power}"
+        assert reader.get_function("x^1") is None
+
+
+def test_read_only(path):
+    """Test for errors while writing to a read-only store"""
+    store.DerivativeStore(path, writable=True).close()
+    with store.DerivativeStore(path) as reader:
+        with pytest.raises(PermissionError):
+            reader.put("x", 'x', "1.0")
+
+
+def test_fallback(path):
+    """Test for consulting the store behind the derivative cache"""
+    with store.DerivativeStore(path, writable=True) as writer:
+        writer.put("x^2", 'x', "stored")
+    DIFF_CACHE.clear()
+    derivative.use_store(store.DerivativeStore(path))
+    try:
+        assert derivative.diff("x^2") == "stored"
+        assert derivative.diff_many(["x^2", "x^3"], workers=2) == \
+            [("x^2", "stored", None), ("x^3", "3.0*x^2.0", None)]
+    finally:
+        derivative.use_store(None)
+        DIFF_CACHE.clear()
@@ -0,0 +1,62 @@
+"""Test module for functions.vectorize"""
+import pytest
+from functions import function
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.mark.parametrize("func, points",
+                         [("x^2+2x+2", [-1.5, 0, 2]),
+                          ("sin(x-1/y)", [1, 2, 3]),
+                          ("e^(lnx/lnpi)", [0.5, 1, 5]),
+                          ("tg(-cos(e^exp(x/2)))", [0, 1, 2])])
+def test_evaluate_array(func, points):
+    """Test for vectorized evaluation matching calculate"""
+    values = function.Function(func).evaluate_array(
+        x=np.array(points), y=np.array(points))
+    expected = [function.Function(func).calculate(x=point, y=point).value
+                for point in points]
+    assert np.allclose(values, expected)
+    assert not values.mask.any()
+
+
+@pytest.mark.parametrize("func, points, expected_mask",
+                         [("x/y", [1, 0, 2], [False, True, False]),
+                          ("x^y", [0, -1, 1], [True, False, False]),
+                          ("x^(1/2)", [-1, 0, 4], [True, False, False]),
+                          ("sqrt(x-5)", [4, 5, 6], [True, False, False]),
+                          ("ln(x^2-4x+3)", [0, 2, 4], [False, True, False])])
+def test_evaluate_array_mask(func, points, expected_mask):
+    """Test for masking points out of the function domain"""
+    values = function.Function(func).evaluate_array(
+        x=np.array(points), y=np.array(points))
+    assert values.mask.tolist() == expected_mask
+
+
+def test_evaluate_array_broadcast():
+    """Test for broadcasting of arrays of points"""
+    values = function.Function("x+y").evaluate_array(
+        x=np.arange(3)[:, None], y=np.arange(4))
+    assert values.shape == (3, 4)
+    assert values[2, 3] == 5
+
+
+@pytest.mark.parametrize("func, points, expected, expected_mask",
+                         [("lnx", [-1, 1, 5], [0, 1, 0.2],
+                           [True, False, False]),
+                          ("sqrt(x^2)", [-2, 0, 2], [-1, 0, 1],
+                           [False, True, False])])
+def test_derive_array(func, points, expected, expected_mask):
+    """Test for vectorized derivatives"""
+    values = function.Function(func).derive_array('x', x=np.array(points))
+    assert values.mask.tolist() == expected_mask
+    assert np.allclose(values.filled(0), expected)
+
+
+@pytest.mark.parametrize("func, point",
+                         [("", {'x': [1]}),
+                          ("x+y", {'x': [1]})])
+def test_evaluate_array_errors(func, point):
+    """Test for functions that can not be evaluated"""
+    with pytest.raises(ValueError):
+        _ = function.Function(func).evaluate_array(**point)